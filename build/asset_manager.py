@@ -8,30 +8,39 @@ from pathlib import Path
 
 from pygments.formatters import HtmlFormatter
 
+from asset_sync import AssetSync
+from image_pipeline import ImagePipeline
+
 
 class AssetManager:
     """Manages static asset copying and CSS generation."""
     
-    def __init__(self, root_dir: Path, dist_dir: Path):
+    # Directories mirrored by copy_assets()
+    ASSET_DIRECTORIES = ("images", "scripts")
+    # Synced directories prune themselves, so cleaning the output can skip them
+    PRESERVED_DIRECTORIES = ASSET_DIRECTORIES + ("variants",)
+    
+    def __init__(self, root_dir: Path, dist_dir: Path, cache_dir: Path):
         self.root_dir = root_dir
         self.dist_dir = dist_dir
+        self.sync = AssetSync()
+        self.image_pipeline = ImagePipeline(root_dir, dist_dir, cache_dir / "images")
     
     def copy_directory(self, src_name: str, dest_name: str = None):
-        """Generic method to copy a directory."""
+        """Generic method to sync a directory, copying only changed files."""
         dest_name = dest_name or src_name
         src_path = self.root_dir / src_name
         dest_path = self.dist_dir / dest_name
         
         if src_path.exists():
-            if dest_path.exists():
-                shutil.rmtree(dest_path)
-            shutil.copytree(src_path, dest_path)
-            print(f"Copied {src_name} to {dest_path}")
+            stats = self.sync.sync_tree(src_path, dest_path)
+            print(f"Synced {src_name} to {dest_path}: {stats['copied']} copied, "
+                  f"{stats['unchanged']} unchanged, {stats['removed']} removed")
     
     def copy_assets(self):
         """Copy static assets to output directory."""
-        self.copy_directory("images")
-        self.copy_directory("scripts")
+        for directory in self.ASSET_DIRECTORIES:
+            self.copy_directory(directory)
     
     def copy_css_files(self):
         """Copy CSS files to output/css directory."""
@@ -42,10 +51,16 @@ class AssetManager:
         
         for css_file in ["shared.css", "main.css"]:
             src_file = css_src_dir / css_file
-            if src_file.exists():
-                shutil.copy2(src_file, css_dest / css_file)
+            if src_file.exists() and self.sync.sync_file(src_file, css_dest / css_file):
                 print(f"Copied {css_file} to {css_dest}")
     
+    def optimize_images(self):
+        """Generate responsive, recompressed variants of the site images."""
+        stats = self.image_pipeline.run()
+        if stats['images']:
+            print(f"Optimized {stats['images']} images: {stats['encoded']} encoded, "
+                  f"{stats['evicted']} stale cache entries removed")
+    
     def generate_pygments_css(self, theme='default'):
         """Generate Pygments CSS for syntax highlighting."""
         formatter = HtmlFormatter(style=theme, cssclass='highlight')
@@ -55,12 +70,19 @@ class AssetManager:
         css_dir.mkdir(exist_ok=True)
         
         css_file = css_dir / 'syntax.css'
+        if css_file.exists() and css_file.read_text() == css_content:
+            return
         css_file.write_text(css_content)
         print(f"Generated syntax highlighting CSS: {css_file}")
     
     def clean_output_directory(self):
-        """Clean and recreate the output directory."""
-        if self.dist_dir.exists():
-            shutil.rmtree(self.dist_dir)
+        """Clean the output directory, keeping asset trees that are synced in place."""
         self.dist_dir.mkdir(exist_ok=True)
+        for entry in self.dist_dir.iterdir():
+            if entry.name in self.PRESERVED_DIRECTORIES and entry.is_dir():
+                continue
+            if entry.is_dir() and not entry.is_symlink():
+                shutil.rmtree(entry)
+            else:
+                entry.unlink()
         print(f"Cleaned output directory: {self.dist_dir}")
\ No newline at end of file
@@ -0,0 +1,141 @@
+"""
+Asset synchronization module for the website builder.
+Mirrors static asset trees into the output directory, touching only what changed.
+"""
+
+import errno
+import hashlib
+import os
+import shutil
+from pathlib import Path
+from typing import Dict
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
+
+# ioctl request number for copy-on-write cloning on Linux (btrfs, XFS, ...)
+FICLONE = 0x40049409
+
+# Errors meaning "this filesystem cannot do that", after which we stop trying
+UNSUPPORTED_ERRNOS = {errno.EXDEV, errno.EPERM, errno.EOPNOTSUPP, errno.EINVAL,
+                      errno.ENOTTY, errno.EMLINK}
+
+
+class AssetSync:
+    """Incrementally mirrors files from a source tree into the output tree.
+
+    Files are compared by size and modification time, falling back to a
+    content hash when the sizes match but the times do not. Changed files
+    are placed by reflink where the filesystem supports copy-on-write
+    clones, then by hardlink, and finally by a plain copy. Destination
+    files are always unlinked before being replaced so a hardlinked output
+    can never be written through to its source.
+    """
+
+    def __init__(self, use_links: bool = True):
+        self.can_clone = use_links and fcntl is not None
+        self.can_link = use_links and hasattr(os, 'link')
+
+    @staticmethod
+    def file_hash(path: Path) -> str:
+        digest = hashlib.sha256()
+        with path.open('rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def is_current(self, src: Path, dest: Path) -> bool:
+        """Check whether dest already holds the same contents as src."""
+        try:
+            dest_stat = dest.stat()
+        except FileNotFoundError:
+            return False
+        src_stat = src.stat()
+        if os.path.samestat(src_stat, dest_stat):
+            return True
+        if src_stat.st_size != dest_stat.st_size:
+            return False
+        if src_stat.st_mtime_ns == dest_stat.st_mtime_ns:
+            return True
+        if self.file_hash(src) != self.file_hash(dest):
+            return False
+        # Same bytes: sync the timestamp so the next check takes the fast path
+        shutil.copystat(src, dest)
+        return True
+
+    def _clone(self, src: Path, dest: Path) -> bool:
+        try:
+            with src.open('rb') as src_file, dest.open('wb') as dest_file:
+                fcntl.ioctl(dest_file.fileno(), FICLONE, src_file.fileno())
+        except OSError as e:
+            dest.unlink(missing_ok=True)
+            if e.errno in UNSUPPORTED_ERRNOS:
+                self.can_clone = False
+            return False
+        shutil.copystat(src, dest)
+        return True
+
+    def _link(self, src: Path, dest: Path) -> bool:
+        try:
+            os.link(src, dest)
+        except OSError as e:
+            if e.errno in UNSUPPORTED_ERRNOS:
+                self.can_link = False
+            return False
+        return True
+
+    def place(self, src: Path, dest: Path):
+        """Put a copy of src at dest using the cheapest supported method."""
+        if dest.is_dir() and not dest.is_symlink():
+            shutil.rmtree(dest)
+        else:
+            dest.unlink(missing_ok=True)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        if self.can_clone and self._clone(src, dest):
+            return
+        if self.can_link and self._link(src, dest):
+            return
+        shutil.copy2(src, dest)
+
+    def sync_file(self, src: Path, dest: Path) -> bool:
+        """Bring a single file up to date; return True if it was replaced."""
+        if self.is_current(src, dest):
+            return False
+        self.place(src, dest)
+        return True
+
+    def sync_tree(self, src_dir: Path, dest_dir: Path) -> Dict[str, int]:
+        """Mirror src_dir into dest_dir, pruning files that no longer exist in src_dir."""
+        stats = {'copied': 0, 'unchanged': 0, 'removed': 0}
+        if dest_dir.exists() and not dest_dir.is_dir():
+            dest_dir.unlink()
+        dest_dir.mkdir(parents=True, exist_ok=True)
+        wanted = set()
+        for src in src_dir.rglob('*'):
+            if src.is_dir():
+                continue
+            relative = src.relative_to(src_dir)
+            wanted.add(relative)
+            if self.sync_file(src, dest_dir / relative):
+                stats['copied'] += 1
+            else:
+                stats['unchanged'] += 1
+        stats['removed'] = self.prune(dest_dir, wanted)
+        return stats
+
+    def prune(self, dest_dir: Path, wanted) -> int:
+        """Delete files under dest_dir that are not in wanted, then empty directories."""
+        removed = 0
+        # Deepest paths first so directories are empty by the time we reach them
+        for dest in sorted(dest_dir.rglob('*'), key=lambda p: len(p.parts), reverse=True):
+            relative = dest.relative_to(dest_dir)
+            if dest.is_dir() and not dest.is_symlink():
+                if not any(dest.iterdir()):
+                    dest.rmdir()
+            elif relative not in wanted:
+                dest.unlink()
+                removed += 1
+        return removed
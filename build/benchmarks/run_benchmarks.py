@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Build benchmarks for the website builder.
+Times cold, warm and incremental builds of a synthetic site and records the results.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+BUILD_DIR = BENCHMARKS_DIR.parent
+REPO_ROOT = BUILD_DIR.parent
+sys.path.insert(0, str(BUILD_DIR))
+
+from synthetic_site import SyntheticSiteGenerator  # noqa: E402
+
+
+# Run in this order, each scenario starting from the state the previous one left
+SCENARIOS = ("cold", "warm", "noop", "single_change")
+DEFAULT_RESULTS = BENCHMARKS_DIR / "results.jsonl"
+DEFAULT_SITE_DIR = Path(tempfile.gettempdir()) / "brh-benchmark-site"
+
+
+def peak_rss_kb() -> Optional[int]:
+    """Peak RSS of this process or any of its worker processes, in KiB."""
+    if resource is None:
+        return None
+    peak = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+               resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    # macOS reports bytes, Linux reports kilobytes
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def prepare_scenario(scenario: str, site_dir: Path):
+    """Put the site into the starting state a scenario measures."""
+    if scenario == "cold":
+        shutil.rmtree(site_dir / ".build-cache", ignore_errors=True)
+        shutil.rmtree(site_dir / "output", ignore_errors=True)
+    elif scenario == "single_change":
+        post = sorted((site_dir / "content" / "news").glob("*.md"))[-1]
+        with post.open("a", encoding="utf-8") as handle:
+            handle.write(f"\nEdited for a benchmark at {time.time_ns()}.\n")
+
+
+def run_scenario(scenario: str, site_dir: Path, jobs: int) -> Dict[str, Any]:
+    """Time one build in this process; called in a fresh interpreter per scenario."""
+    from build_modular import WebsiteBuilder
+    prepare_scenario(scenario, site_dir)
+    incremental = scenario in ("noop", "single_change")
+    started = time.perf_counter()
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        builder = WebsiteBuilder(incremental=incremental, jobs=jobs, root_dir=site_dir)
+        builder.build()
+    return {
+        'seconds': round(time.perf_counter() - started, 4),
+        'pages_rendered': len(builder.rebuilt_outputs),
+        'peak_rss_kb': peak_rss_kb(),
+    }
+
+
+def spawn_scenario(scenario: str, site_dir: Path, jobs: int) -> Dict[str, Any]:
+    """Run a scenario in a child interpreter so imports and memory start clean."""
+    command = [sys.executable, str(Path(__file__).resolve()), "--run-scenario", scenario,
+               "--site-dir", str(site_dir), "--jobs", str(jobs)]
+    result = subprocess.run(command, cwd=BUILD_DIR, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"Scenario {scenario} failed:\n{result.stderr}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def summarize(samples: List[Dict[str, Any]]) -> Dict[str, Any]:
+    seconds = [sample['seconds'] for sample in samples]
+    memory = [sample['peak_rss_kb'] for sample in samples if sample['peak_rss_kb'] is not None]
+    return {
+        'median_seconds': round(statistics.median(seconds), 4),
+        'min_seconds': min(seconds),
+        'pages_rendered': samples[-1]['pages_rendered'],
+        'peak_rss_kb': max(memory) if memory else None,
+        'samples': seconds,
+    }
+
+
+def git_commit() -> Optional[str]:
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+                                capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def load_results(results_file: Path) -> List[Dict[str, Any]]:
+    if not results_file.exists():
+        return []
+    lines = results_file.read_text(encoding="utf-8").splitlines()
+    return [json.loads(line) for line in lines if line.strip()]
+
+
+def previous_comparable(results: List[Dict[str, Any]], record: Dict[str, Any]):
+    """Latest earlier run with the same site size and job count."""
+    for earlier in reversed(results):
+        if earlier['site'] == record['site'] and earlier['jobs'] == record['jobs']:
+            return earlier
+    return None
+
+
+def print_report(record: Dict[str, Any], baseline: Optional[Dict[str, Any]]):
+    site = record['site']
+    print(f"\nSite: {site['news']} news, {site['projects']} projects, {site['members']} members "
+          f"({record['jobs']} jobs, {record['repeat']} runs each)")
+    if baseline:
+        print(f"Compared with {baseline['commit']} from {baseline['timestamp']}")
+    print(f"  {'scenario':<14} {'median':>9} {'min':>9} {'pages':>7} {'peak RSS':>10}")
+    for scenario, summary in record['scenarios'].items():
+        memory = summary['peak_rss_kb']
+        line = (f"  {scenario:<14} {summary['median_seconds']:8.2f}s {summary['min_seconds']:8.2f}s "
+                f"{summary['pages_rendered']:>7} "
+                + (f"{memory / 1024:7.1f} MiB" if memory is not None else f"{'n/a':>10}"))
+        before = baseline['scenarios'].get(scenario) if baseline else None
+        if before:
+            change = summary['median_seconds'] / before['median_seconds'] - 1
+            line += f"  {change:+.1%}"
+        print(line)
+
+
+def run_benchmarks(args) -> Dict[str, Any]:
+    print(f"Generating synthetic site in {args.site_dir}...")
+    generator = SyntheticSiteGenerator(REPO_ROOT, seed=args.seed)
+    generator.generate(args.site_dir, args.news, args.projects, args.members,
+                       with_images=args.with_images)
+    samples = {scenario: [] for scenario in SCENARIOS}
+    for run in range(args.repeat):
+        for scenario in SCENARIOS:
+            print(f"Run {run + 1}/{args.repeat}: {scenario}")
+            samples[scenario].append(spawn_scenario(scenario, args.site_dir, args.jobs))
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'commit': git_commit(),
+        'label': args.label,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'jobs': args.jobs,
+        'repeat': args.repeat,
+        'site': {'news': args.news, 'projects': args.projects, 'members': args.members,
+                 'seed': args.seed, 'images': args.with_images},
+        'scenarios': {scenario: summarize(runs) for scenario, runs in samples.items()},
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the website build on a synthetic site")
+    parser.add_argument('--news', type=int, default=2000, help="number of news posts")
+    parser.add_argument('--projects', type=int, default=300, help="number of projects")
+    parser.add_argument('--members', type=int, default=500, help="number of members")
+    parser.add_argument('--seed', type=int, default=1, help="seed for the generated content")
+    parser.add_argument('--with-images', action='store_true',
+                        help="copy the real images so the image pipeline is included")
+    parser.add_argument('-j', '--jobs', type=int, default=1, help="worker processes per build")
+    parser.add_argument('--repeat', type=int, default=3, help="runs of each scenario")
+    parser.add_argument('--site-dir', type=Path, default=DEFAULT_SITE_DIR,
+                        help="where to generate the synthetic site")
+    parser.add_argument('--results', type=Path, default=DEFAULT_RESULTS,
+                        help="JSON lines file the results are appended to")
+    parser.add_argument('--label', default='', help="free-form note stored with the results")
+    parser.add_argument('--no-save', action='store_true', help="do not record this run")
+    parser.add_argument('--run-scenario', choices=SCENARIOS, help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def main():
+    args = parse_args()
+    if args.run_scenario:
+        print(json.dumps(run_scenario(args.run_scenario, args.site_dir, args.jobs)))
+        return
+    results = load_results(args.results)
+    try:
+        record = run_benchmarks(args)
+    except ValueError as e:
+        sys.exit(f"Error: {e}")
+    print_report(record, previous_comparable(results, record))
+    if not args.no_save:
+        with args.results.open('a', encoding='utf-8') as handle:
+            handle.write(json.dumps(record) + '\n')
+        print(f"Appended results to {args.results}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""
+Synthetic site generator for build benchmarks.
+Creates a site tree with thousands of realistic news posts, projects and members.
+"""
+
+import random
+import shutil
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict
+
+
+WORDS = (
+    "robot arm servo lidar sensor motor driver encoder wheel chassis battery "
+    "firmware ros2 navigation slam odometry camera vision gripper pid tuning "
+    "raspberry arduino esp32 jetson microcontroller kinematics simulation gazebo "
+    "meeting workshop demo hackathon soldering printing laser cutter design "
+    "prototype testing calibration teleoperation autonomy mapping planner"
+).split()
+
+SKILLS = ["ROS2", "Python", "C++", "CAD", "Electronics", "Machine Learning",
+          "Computer Vision", "Embedded", "3D Printing", "Soldering", "Rust", "Control"]
+STATUSES = ["initial testing", "active development", "Retired", "Done and done.",
+            "Needs update to ROS2", "prototype development"]
+ROLES = ["Member", "Organizer", "Mentor", "Founder", "Contributor"]
+
+CODE_SAMPLES = {
+    'python': '''import rclpy
+from geometry_msgs.msg import Twist
+
+def drive(node, speed: float, turn: float):
+    msg = Twist()
+    msg.linear.x = speed
+    msg.angular.z = turn
+    node.publisher.publish(msg)
+    return msg
+''',
+    'cpp': '''#include <Servo.h>
+
+Servo arm;
+
+void setup() {
+  arm.attach(9);
+  Serial.begin(115200);
+}
+
+void loop() {
+  for (int angle = 0; angle <= 180; angle += 5) {
+    arm.write(angle);
+    delay(15);
+  }
+}
+''',
+    'yaml': '''controller:
+  type: diff_drive_controller/DiffDriveController
+  wheel_separation: 0.287
+  wheel_radius: 0.033
+  publish_rate: 50.0
+''',
+}
+
+# Parts of the real site reused as-is by every synthetic site
+COPIED_PATHS = ("templates", "config", "css", "scripts",
+                "content/heroes", "content/about.md", "content/nextmeeting.md")
+# Written into every generated site; only directories holding it are ever deleted
+MARKER_FILE = ".synthetic-site"
+
+
+class SyntheticSiteGenerator:
+    """Writes a deterministic synthetic site for a given seed and size."""
+
+    def __init__(self, source_root: Path, seed: int = 1):
+        self.source_root = source_root
+        self.random = random.Random(seed)
+
+    def words(self, count: int) -> str:
+        return ' '.join(self.random.choice(WORDS) for _ in range(count))
+
+    def sentence(self) -> str:
+        return self.words(self.random.randint(8, 18)).capitalize() + '.'
+
+    def paragraph(self) -> str:
+        return ' '.join(self.sentence() for _ in range(self.random.randint(3, 6)))
+
+    def table(self) -> str:
+        rows = ["| Part | Quantity | Notes |", "|------|----------|-------|"]
+        for _ in range(self.random.randint(3, 8)):
+            rows.append(f"| {self.words(2)} | {self.random.randint(1, 20)} | {self.words(4)} |")
+        return '\n'.join(rows)
+
+    def code_block(self) -> str:
+        language = self.random.choice(sorted(CODE_SAMPLES))
+        return f"```{language}\n{CODE_SAMPLES[language]}```"
+
+    def body(self) -> str:
+        """Markdown body with headings, paragraphs, lists, fenced code and tables."""
+        sections = []
+        for _ in range(self.random.randint(2, 4)):
+            sections.append(f"## {self.words(3).title()}")
+            sections.append(self.paragraph())
+            block = self.random.random()
+            if block < 0.4:
+                sections.append(self.code_block())
+            elif block < 0.7:
+                sections.append(self.table())
+            else:
+                sections.append('\n'.join(f"- {self.words(5)}" for _ in range(4)))
+            sections.append(self.paragraph())
+        return '\n\n'.join(sections) + '\n'
+
+    @staticmethod
+    def front_matter(fields: Dict) -> str:
+        lines = ['---']
+        for key, value in fields.items():
+            if isinstance(value, list):
+                lines.append(f"{key}:")
+                lines.extend(f"  - {item}" for item in value)
+            elif isinstance(value, str):
+                lines.append(f'{key}: "{value}"')
+            else:
+                lines.append(f"{key}: {str(value).lower() if isinstance(value, bool) else value}")
+        lines.append('---')
+        return '\n'.join(lines) + '\n\n'
+
+    def write_news(self, directory: Path, count: int):
+        start = date(2015, 1, 1)
+        for number in range(count):
+            day = start + timedelta(days=number * 3650 // max(count, 1))
+            fields = {
+                'title': self.words(5).title(),
+                'date': day.isoformat(),
+                'image': "images/robot-logo.png",
+                'excerpt': self.sentence(),
+                'highlight': self.random.random() < 0.05,
+                'tags': self.random.sample(SKILLS, 2),
+            }
+            path = directory / f"{day.isoformat()}-post-{number:05d}.md"
+            path.write_text(self.front_matter(fields) + self.body(), encoding='utf-8')
+
+    def write_projects(self, directory: Path, count: int):
+        for number in range(count):
+            fields = {
+                'title': f"Project {self.words(2).title()} {number}",
+                'date': (date(2005, 1, 1) + timedelta(days=self.random.randint(0, 7000))).isoformat(),
+                'status': self.random.choice(STATUSES),
+                'image': "images/robot-logo.png",
+                'text': self.words(2).title(),
+                'lead': f"Member {self.random.randrange(max(count, 1)):05d}",
+                'excerpt': self.sentence(),
+            }
+            path = directory / f"project-{number:05d}.md"
+            path.write_text(self.front_matter(fields) + self.body(), encoding='utf-8')
+
+    def write_members(self, directory: Path, count: int):
+        for number in range(count):
+            fields = {
+                'name': f"Member {number:05d} {self.words(1).title()}",
+                'role': self.random.choice(ROLES),
+                'image': "images/robot-logo.png",
+                'featured': self.random.random() < 0.2,
+                'skills': self.random.sample(SKILLS, self.random.randint(1, 5)),
+                'github': f"https://github.com/member{number:05d}",
+                'opentowork': self.random.random() < 0.1,
+            }
+            path = directory / f"member-{number:05d}.md"
+            path.write_text(self.front_matter(fields) + self.body(), encoding='utf-8')
+
+    def copy_site_skeleton(self, root: Path, with_images: bool):
+        paths = COPIED_PATHS + (("images",) if with_images else ())
+        for relative in paths:
+            source = self.source_root / relative
+            target = root / relative
+            if source.is_dir():
+                shutil.copytree(source, target)
+            elif source.exists():
+                target.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(source, target)
+
+    def generate(self, root: Path, news: int, projects: int, members: int,
+                 with_images: bool = False) -> Path:
+        """Create a fresh synthetic site at root and return it.
+
+        An existing root is only replaced if an earlier run generated it;
+        any other non-empty directory raises ValueError instead.
+        """
+        if root.exists():
+            if not (root / MARKER_FILE).is_file() and any(root.iterdir()):
+                raise ValueError(f"Refusing to replace {root}: it is not empty and was not "
+                                 f"created by the synthetic site generator")
+            shutil.rmtree(root)
+        root.mkdir(parents=True)
+        (root / MARKER_FILE).write_text("Generated by benchmarks/synthetic_site.py\n")
+        self.copy_site_skeleton(root, with_images)
+        for name, count, writer in (('news', news, self.write_news),
+                                    ('projects', projects, self.write_projects),
+                                    ('members', members, self.write_members)):
+            directory = root / 'content' / name
+            directory.mkdir(parents=True, exist_ok=True)
+            writer(directory, count)
+        return root
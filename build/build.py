@@ -13,9 +13,10 @@ from typing import List, Dict, Any
 
 import frontmatter
 import markdown
-from jinja2 import Environment, FileSystemLoader
 from pygments.formatters import HtmlFormatter
 
+from templating import create_jinja_environment
+
 
 class WebsiteBuilder:
     def __init__(self):
@@ -38,13 +39,8 @@ class WebsiteBuilder:
         
         # CTA content removed - now included directly in hero markdown
         
-        # Set up Jinja2 environment
-        template_paths = [
-            str(self.templates_dir),               # Main templates directory
-        ]
-        self.jinja_env = Environment(
-            loader=FileSystemLoader(template_paths)
-        )
+        # Set up Jinja2 environment (shared with the modular builder's template helpers)
+        self.jinja_env = create_jinja_environment(self.templates_dir)
     
     def load_site_config(self) -> Dict[str, Any]:
         """Load site configuration."""
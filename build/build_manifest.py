@@ -0,0 +1,210 @@
+"""
+Build manifest module for the website builder.
+Tracks content hashes of build inputs so unchanged outputs can be skipped.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from jinja2 import Environment, meta
+
+from build_profiler import BuildProfiler
+
+
+MANIFEST_VERSION = 2
+
+
+class BuildManifest:
+    """Persistent map of generated outputs to a digest of their inputs' hashes.
+
+    One digest per output keeps the manifest small even when many outputs
+    (e.g. every page of a paginated listing) depend on the same large set
+    of files.
+    """
+
+    def __init__(self, manifest_file: Path, root_dir: Path):
+        self.manifest_file = manifest_file
+        self.root_dir = root_dir
+        self._resolved_root = root_dir.resolve()
+        self.previous: Dict[str, str] = {}
+        self.current: Dict[str, str] = {}
+        self._hashes: Dict[Path, str] = {}
+        self._keys: Dict[Path, str] = {}
+        self._digests: Dict[Tuple[Path, ...], str] = {}
+        # template name -> {'sha256': ..., 'references': [...]}
+        self.previous_templates: Dict[str, Dict] = {}
+        self.templates: Dict[str, Dict] = {}
+
+    def load(self):
+        """Load the manifest from the previous build, if there is one."""
+        self.previous = {}
+        self.current = {}
+        self._hashes = {}
+        self._digests = {}
+        self.previous_templates = {}
+        self.templates = {}
+        if not self.manifest_file.exists():
+            return
+        try:
+            data = json.loads(self.manifest_file.read_text())
+        except (OSError, ValueError) as e:
+            print(f"Warning: ignoring unreadable build manifest {self.manifest_file}: {e}")
+            return
+        if data.get('version') == MANIFEST_VERSION:
+            self.previous = data.get('outputs', {})
+            self.previous_templates = data.get('templates', {})
+
+    def save(self):
+        """Write the outputs recorded during this build to disk."""
+        self.manifest_file.parent.mkdir(parents=True, exist_ok=True)
+        data = {'version': MANIFEST_VERSION, 'outputs': self.current,
+                'templates': self.templates}
+        self.manifest_file.write_text(json.dumps(data, indent=1, sort_keys=True))
+
+    def file_hash(self, path: Path) -> str:
+        """Return the SHA-256 of a file, memoized for the lifetime of a build."""
+        if path not in self._hashes:
+            try:
+                self._hashes[path] = hashlib.sha256(path.read_bytes()).hexdigest()
+            except FileNotFoundError:
+                self._hashes[path] = ''
+        return self._hashes[path]
+
+    def _key(self, path: Path) -> str:
+        """Manifest key for a path, relative to the site root."""
+        if path not in self._keys:
+            resolved = path.resolve()
+            try:
+                self._keys[path] = resolved.relative_to(self._resolved_root).as_posix()
+            except ValueError:
+                self._keys[path] = resolved.as_posix()
+        return self._keys[path]
+
+    def _input_digest(self, inputs: Iterable[Path]) -> str:
+        """Digest of the inputs' names and content hashes, independent of their order."""
+        inputs = tuple(inputs)
+        if inputs not in self._digests:
+            hashes = sorted(f"{self._key(path)}:{self.file_hash(path)}" for path in inputs)
+            self._digests[inputs] = hashlib.sha256('\n'.join(hashes).encode('utf-8')).hexdigest()
+        return self._digests[inputs]
+
+    def needs_build(self, output: Path, inputs: Iterable[Path]) -> bool:
+        """Check whether an output is missing or any of its inputs changed.
+
+        Up-to-date outputs are carried over into the new manifest so they
+        are not pruned at the end of the build.
+        """
+        key = self._key(output)
+        digest = self._input_digest(inputs)
+        if output.exists() and self.previous.get(key) == digest:
+            self.current[key] = digest
+            return False
+        return True
+
+    def template_references(self, name: str, digest: str) -> Optional[List[str]]:
+        """References of a template recorded for this exact source, if known."""
+        for known in (self.templates, self.previous_templates):
+            entry = known.get(name)
+            if entry and entry['sha256'] == digest:
+                return entry['references']
+        return None
+
+    def record_template_references(self, name: str, digest: str, references: List[str]):
+        self.templates[name] = {'sha256': digest, 'references': references}
+
+    def previous_outputs(self, directory: Path) -> List[Path]:
+        """Outputs the previous build recorded below a directory."""
+        prefix = self._key(directory) + '/'
+        return [self.root_dir / key for key in sorted(self.previous) if key.startswith(prefix)]
+
+    def record(self, output: Path, inputs: Iterable[Path]):
+        """Record that an output was generated from the given inputs."""
+        self.current[self._key(output)] = self._input_digest(inputs)
+
+    def prune_stale_outputs(self) -> List[str]:
+        """Delete outputs from the previous build that were not produced this time."""
+        removed = []
+        for key in sorted(set(self.previous) - set(self.current)):
+            output = self.root_dir / key
+            if output.exists():
+                output.unlink()
+                removed.append(key)
+                self._remove_empty_parents(output, key)
+        return removed
+
+    @staticmethod
+    def _remove_empty_parents(output: Path, key: str):
+        """Delete directories left empty below the output root, e.g. whatsnew/page/."""
+        parent = output.parent
+        # The key's first part is the output directory itself, which is kept
+        for _ in range(key.count('/') - 1):
+            try:
+                parent.rmdir()
+            except OSError:
+                return
+            parent = parent.parent
+
+
+class TemplateDependencies:
+    """Resolves the templates a Jinja template extends, includes or imports.
+
+    Each template's direct references are stored in the manifest keyed by
+    the template's hash, so an unchanged template is never parsed again
+    just to find its dependencies.
+    """
+
+    def __init__(self, jinja_env: Environment, templates_dir: Path, manifest: BuildManifest,
+                 profiler: Optional[BuildProfiler] = None):
+        self.jinja_env = jinja_env
+        self.templates_dir = templates_dir
+        self.manifest = manifest
+        self.profiler = profiler or BuildProfiler()
+        self._cache: Dict[str, List[Path]] = {}
+        self._references: Dict[str, List[str]] = {}
+
+    def clear(self):
+        """Forget resolved dependencies, e.g. after a template was edited."""
+        self._cache.clear()
+        self._references.clear()
+
+    def files_for(self, *template_names: str) -> List[Path]:
+        """Return the template files needed to render the given templates."""
+        files: Set[Path] = set()
+        for name in template_names:
+            if name not in self._cache:
+                self._cache[name] = sorted(self.templates_dir / t for t in self._closure(name))
+            files.update(self._cache[name])
+        return sorted(files)
+
+    def references(self, template_name: str) -> List[str]:
+        """Templates referenced directly by one template, parsing it only when it changed."""
+        if template_name not in self._references:
+            path = self.templates_dir / template_name
+            digest = self.manifest.file_hash(path)
+            references = self.manifest.template_references(template_name, digest)
+            if references is None:
+                references = self._parse_references(path) if digest else []
+            self.manifest.record_template_references(template_name, digest, references)
+            self._references[template_name] = references
+        return self._references[template_name]
+
+    def _parse_references(self, path: Path) -> List[str]:
+        self.profiler.count('templates_parsed_for_dependencies')
+        with self.profiler.timed('template_dependencies', path.relative_to(self.templates_dir)):
+            ast = self.jinja_env.parse(path.read_text(encoding='utf-8'))
+            # Dynamic references (None) cannot be resolved statically
+            return sorted(ref for ref in meta.find_referenced_templates(ast) if ref)
+
+    def _closure(self, template_name: str) -> Set[str]:
+        """Walk template references transitively."""
+        seen: Set[str] = set()
+        pending = [template_name]
+        while pending:
+            name = pending.pop()
+            if name in seen:
+                continue
+            seen.add(name)
+            pending.extend(self.references(name))
+        return seen
@@ -4,24 +4,37 @@ Modular build script for Boston Robot Hackers website.
 Split into focused modules for better maintainability.
 """
 
+import argparse
+import cProfile
 import json
+from concurrent.futures import Executor
 from pathlib import Path
-from typing import Dict, Any
-
-from jinja2 import Environment, FileSystemLoader
+from typing import Dict, Any, Iterable, List, Optional, Set
 
 from asset_manager import AssetManager
-from content_manager import ContentManager, ContentType
+from build_manifest import BuildManifest, TemplateDependencies
+from build_profiler import BuildProfiler
+from content_manager import ContentManager, ContentType, item_tags
+from content_repository import ContentRepository
+from dev_server import DevServer
+from markdown_cache import MarkdownCache
 from page_builder import PageBuilder
+from pagination import DEFAULT_PAGE_SIZE, Listing, root_prefix, tag_archive, year_archive
+from parallel_build import create_pool
+from search_index import SEARCH_INDEX_FILE, SearchIndex
+from templating import create_jinja_environment
 
 
 class WebsiteBuilder:
     """Main website builder orchestrating all components."""
     
-    def __init__(self):
+    def __init__(self, incremental: bool = False, jobs: int = 1, use_cache: bool = True,
+                 profile: Optional[str] = None, root_dir: Optional[Path] = None):
         # Detect if running from build/ subdirectory or root directory
         current_dir = Path.cwd()
-        if current_dir.name == "build":
+        if root_dir is not None:
+            self.root_dir = Path(root_dir)
+        elif current_dir.name == "build":
             self.root_dir = Path("..")
         else:
             self.root_dir = Path(".")
@@ -30,6 +43,21 @@ class WebsiteBuilder:
         self.config_dir = self.root_dir / "config"
         self.content_dir = self.root_dir / "content"
         self.dist_dir = self.root_dir / "output"
+        self.cache_dir = self.root_dir / ".build-cache"
+        self.incremental = incremental
+        self.jobs = jobs
+        # Worker pool kept open across builds by open_pool(), e.g. by the dev server
+        self.pool: Optional[Executor] = None
+        # Outputs rendered by the latest build, relative to the output directory
+        self.rebuilt_outputs: List[str] = []
+        # Stale outputs of the current build and their inputs, until written
+        self.pending_outputs: Dict[str, List[Path]] = {}
+        # Timings are only collected when a profile report was requested;
+        # an empty path selects the default location in the build cache
+        self.profile_file = None
+        if profile is not None:
+            self.profile_file = Path(profile) if profile else self.cache_dir / "profile.json"
+        self.profiler = BuildProfiler(enabled=self.profile_file is not None)
         
         # Create dist directory if it doesn't exist
         self.dist_dir.mkdir(exist_ok=True)
@@ -37,14 +65,35 @@ class WebsiteBuilder:
         # Load configurations
         self.site_config = self.load_site_config()
         
-        # Set up Jinja2 environment
-        template_paths = [str(self.templates_dir)]
-        self.jinja_env = Environment(loader=FileSystemLoader(template_paths))
-        
         # Initialize managers
-        self.content_manager = ContentManager(self.content_dir)
-        self.page_builder = PageBuilder(self.jinja_env, self.dist_dir, self.site_config)
-        self.asset_manager = AssetManager(self.root_dir, self.dist_dir)
+        self.asset_manager = AssetManager(self.root_dir, self.dist_dir, self.cache_dir)
+        self.image_index_file = self.asset_manager.image_pipeline.index_file
+        
+        # Set up Jinja2 environment; compiled templates are cached between builds
+        self.bytecode_cache_dir = self.cache_dir / "jinja" if use_cache else None
+        self.jinja_env = create_jinja_environment(self.templates_dir, self.image_index_file,
+                                                  self.bytecode_cache_dir)
+        self.profiler.instrument_jinja(self.jinja_env)
+        
+        # Rendered markdown is cached on disk between builds
+        self.markdown_cache = None
+        if use_cache:
+            self.markdown_cache = MarkdownCache(self.cache_dir / "markdown",
+                                                ContentManager.markdown_config())
+        
+        # Content is parsed once per build and shared by every page
+        self.content_manager = ContentRepository(self.content_dir, self.markdown_cache,
+                                                 self.profiler)
+        self.page_builder = PageBuilder(self.jinja_env, self.dist_dir, self.site_config,
+                                        self.profiler)
+        self.page_builder.search_index = SEARCH_INDEX_FILE
+        
+        # Track input hashes so incremental builds can skip unchanged outputs
+        self.manifest = BuildManifest(self.cache_dir / "manifest.json", self.root_dir)
+        self.template_deps = TemplateDependencies(self.jinja_env, self.templates_dir,
+                                                  self.manifest, self.profiler)
+        self.global_inputs = [self.config_dir / "site.json", self.image_index_file,
+                              *sorted(Path(__file__).resolve().parent.glob('*.py'))]
         
         # Define content types
         self.content_types = {
@@ -64,10 +113,93 @@ class WebsiteBuilder:
             return json.loads(config_file.read_text())
         return {}
     
+    def is_stale(self, output_name: str, templates: Iterable[str],
+                 sources: Iterable[Path]) -> bool:
+        """Check whether an output must be rendered and remember its inputs.
+        
+        The inputs are only recorded in the manifest once the output was
+        actually written (see record_outputs), so a page whose content
+        failed to load is not marked up to date.
+        """
+        output_file = self.dist_dir / output_name
+        inputs = self.output_inputs(templates, sources)
+        if self.incremental and not self.manifest.needs_build(output_file, inputs):
+            return False
+        self.pending_outputs[output_name] = inputs
+        return True
+    
+    def output_inputs(self, templates: Iterable[str], sources: Iterable[Path]) -> List[Path]:
+        """Every file an output depends on."""
+        return [*self.global_inputs, *self.template_deps.files_for(*templates), *sources]
+    
+    def is_listing_stale(self, first_page: str, page_dirs: Iterable[str],
+                         templates: List[str], sources: List[Path]) -> bool:
+        """Check whether any page of a paginated listing must be rendered.
+        
+        All pages of a listing share their inputs. Pages the previous build
+        wrote below ``page_dirs`` are checked as well, which carries fresh
+        ones over into the new manifest instead of pruning them.
+        """
+        if not self.incremental:
+            return True
+        inputs = self.output_inputs(templates, sources)
+        outputs = [self.dist_dir / first_page]
+        for page_dir in page_dirs:
+            outputs.extend(self.manifest.previous_outputs(self.dist_dir / page_dir))
+        return any([self.manifest.needs_build(output, inputs) for output in outputs])
+    
+    def page_size(self, content_type: ContentType) -> int:
+        """Items per listing page, set as ``<type>_page_size`` in config/site.json."""
+        return int(self.site_config.get(f"{content_type.name}_page_size", DEFAULT_PAGE_SIZE))
+    
+    def build_listing(self, listing: Listing, templates: List[str], sources: List[Path],
+                      render_cards, content_name: str, **context):
+        """Render the pages of a listing whose inputs changed."""
+        for page in listing.pages():
+            output_name = page['output_name']
+            if not self.is_stale(output_name, templates, sources):
+                continue
+            cards = render_cards(page['items'], prefix=root_prefix(output_name))
+            self.page_builder.build_page(templates[0], output_name,
+                                         pagination=page['pagination'],
+                                         archive_title=listing.title,
+                                         **{content_name: cards}, **context)
+    
+    def news_archives(self, page_size: int):
+        """Tag and year archive listings of the news, and the links to them."""
+        news_type = self.content_types['news']
+        tags = sorted(self.content_manager.by_tag(news_type).items(), key=lambda t: t[0].lower())
+        years = sorted(self.content_manager.by_year(news_type).items(), reverse=True)
+        if len(years) < 2:
+            # A single year archive would repeat the listing; whatsnew.html does not link it
+            years = []
+        listings = [Listing(tag_archive(tag), posts, page_size, f"Posts tagged {tag}")
+                    for tag, posts in tags]
+        listings += [Listing(year_archive(year), posts, page_size, f"Posts from {year}")
+                     for year, posts in years]
+        links = {
+            'tags': [{'name': tag, 'url': tag_archive(tag)} for tag, _ in tags],
+            'years': [{'name': year, 'url': year_archive(year)} for year, _ in years],
+        }
+        return listings, links
+    
+    def stale_detail_ids(self, content_type: ContentType, files: List[Path]) -> Set[str]:
+        """Return ids of the detail pages whose source or template changed."""
+        return {
+            md_file.stem for md_file in files
+            if self.is_stale(f"{content_type.directory}/{md_file.stem}.html",
+                             [content_type.detail_template], [md_file])
+        }
+    
+    def build_detail_pages(self, items: List[Dict], content_type: ContentType, stale_ids: Set[str]):
+        """Build detail pages for the items that changed."""
+        changed = [item for item in items if item['id'] in stale_ids]
+        self.page_builder.build_detail_pages(changed, content_type)
+    
     def build_whatsnew(self) -> str:
         """Build the What's New section from markdown files (highlighted only)."""
         posts = self.content_manager.get_all_content(self.content_types['news'])
-        highlighted_posts = [post for post in posts if post['metadata'].get('highlight', False)]
+        highlighted_posts = self.content_manager.highlighted(self.content_types['news'])
         
         news_html = self.page_builder.render_news_cards(highlighted_posts)
         print(f"Generated {len(highlighted_posts)} highlighted posts from {len(posts)} total")
@@ -75,6 +207,14 @@ class WebsiteBuilder:
     
     def build_index(self):
         """Build the main index.html file."""
+        news_files = self.content_manager.content_files(self.content_types['news'])
+        project_files = self.content_manager.content_files(self.content_types['projects'])
+        sources = [*news_files, *project_files, self.content_manager.hero_file('index')]
+        templates = ['pages/index.html', 'cards/news-card.html', 'cards/project-card.html']
+        if not self.is_stale('index.html', templates, sources):
+            print("index.html is up to date")
+            return
+        
         news_content = self.build_whatsnew()
         hero_content = self.content_manager.build_hero_content()
         
@@ -92,43 +232,73 @@ class WebsiteBuilder:
         print(f"Generated {output_file}")
     
     def build_news_page(self):
-        """Build the whatsnew.html page with all news items."""
-        posts = self.content_manager.get_all_content(self.content_types['news'])
-        self.page_builder.build_detail_pages(posts, self.content_types['news'])
+        """Build the paginated What's New listing, its archives and the news detail pages."""
+        news_type = self.content_types['news']
+        files = self.content_manager.content_files(news_type)
+        stale_ids = self.stale_detail_ids(news_type, files)
+        templates = ['pages/whatsnew.html', 'cards/compact-news-card.html']
+        sources = [*files, self.content_manager.hero_file('whatsnew')]
+        listing_stale = self.is_listing_stale('whatsnew.html', ['whatsnew'], templates, sources)
+        if not (stale_ids or listing_stale):
+            print("whatsnew.html and news detail pages are up to date")
+            return
         
-        news_content = self.page_builder.render_compact_news_cards(posts)
-        hero_content = self.content_manager.build_hero_content('whatsnew')
+        posts = self.content_manager.get_all_content(news_type)
+        self.build_detail_pages(posts, news_type, stale_ids)
+        if not listing_stale:
+            return
         
-        self.page_builder.build_page(
-            'pages/whatsnew.html',
-            'whatsnew.html',
-            hero=hero_content,
-            news_content=news_content
-        )
+        page_size = self.page_size(news_type)
+        archives, archive_links = self.news_archives(page_size)
+        hero_content = self.content_manager.build_hero_content('whatsnew')
+        for listing in [Listing('whatsnew.html', posts, page_size), *archives]:
+            self.build_listing(listing, templates, sources,
+                               self.page_builder.render_compact_news_cards, 'news_content',
+                               hero=hero_content, archives=archive_links)
         
-        print(f"Built whatsnew.html with {len(posts)} posts")
+        print(f"Built whatsnew.html with {len(posts)} posts and {len(archives)} archives")
     
     def build_projects_page(self):
         """Build the projects.html page."""
-        projects = self.content_manager.get_all_content(self.content_types['projects'])
-        self.page_builder.build_detail_pages(projects, self.content_types['projects'])
+        projects_type = self.content_types['projects']
+        files = self.content_manager.content_files(projects_type)
+        stale_ids = self.stale_detail_ids(projects_type, files)
+        templates = ['pages/projects.html', 'cards/project-listing-item.html']
+        sources = [*files, self.content_manager.hero_file('projects')]
+        listing_stale = self.is_listing_stale('projects.html', ['projects/page'], templates, sources)
+        if not (stale_ids or listing_stale):
+            print("projects.html and project detail pages are up to date")
+            return
         
-        projects_content = self.page_builder.render_projects_content(projects)
-        hero_content = self.content_manager.build_hero_content('projects')
+        projects = self.content_manager.get_all_content(projects_type)
+        self.build_detail_pages(projects, projects_type, stale_ids)
+        if not listing_stale:
+            return
         
-        self.page_builder.build_page(
-            'pages/projects.html',
-            'projects.html',
-            hero=hero_content,
-            projects_content=projects_content
-        )
+        hero_content = self.content_manager.build_hero_content('projects')
+        listing = Listing('projects.html', projects, self.page_size(projects_type))
+        self.build_listing(listing, templates, sources,
+                           self.page_builder.render_projects_content, 'projects_content',
+                           hero=hero_content)
         
         print(f"Built projects.html with {len(projects)} projects")
     
     def build_members_page(self):
         """Build the members.html page."""
-        members = self.content_manager.get_all_content(self.content_types['members'])
-        self.page_builder.build_detail_pages(members, self.content_types['members'])
+        members_type = self.content_types['members']
+        files = self.content_manager.content_files(members_type)
+        stale_ids = self.stale_detail_ids(members_type, files)
+        listing_stale = self.is_stale(
+            'members.html', ['pages/members.html', 'cards/member-card.html'],
+            [*files, self.content_manager.hero_file('members')])
+        if not (stale_ids or listing_stale):
+            print("members.html and member detail pages are up to date")
+            return
+        
+        members = self.content_manager.get_all_content(members_type)
+        self.build_detail_pages(members, members_type, stale_ids)
+        if not listing_stale:
+            return
         
         members_content = self.page_builder.render_member_cards(members)
         hero_content = self.content_manager.build_hero_content('members')
@@ -144,6 +314,11 @@ class WebsiteBuilder:
     
     def build_about_page(self):
         """Build the about.html page."""
+        sources = [self.content_dir / 'about.md', self.content_manager.hero_file('about')]
+        if not self.is_stale('about.html', ['pages/about.html'], sources):
+            print("about.html is up to date")
+            return
+        
         about_content = self.content_manager.process_single_content_file('about.md')
         hero_content = self.content_manager.build_hero_content('about')
         
@@ -159,13 +334,16 @@ class WebsiteBuilder:
     def build_nextmeeting_page(self):
         """Build the nextmeeting.html page."""
         nextmeeting_file = self.content_dir / 'nextmeeting.md'
+        if not self.is_stale('nextmeeting/index.html', ['pages/nextmeeting.html'], [nextmeeting_file]):
+            print("nextmeeting/index.html is up to date")
+            return
         
         if not nextmeeting_file.exists():
             print(f"Warning: {nextmeeting_file} not found")
             nextmeeting_content = "<p>Next meeting content not found.</p>"
             hero_content = {'hero_title': 'Next Meeting', 'hero_subtitle': '', 'hero_content': ''}
         else:
-            nextmeeting_data = self.content_manager.process_markdown_file(nextmeeting_file)
+            nextmeeting_data = self.content_manager.load_file(nextmeeting_file)
             nextmeeting_content = nextmeeting_data['content'] if nextmeeting_data else "<p>Error processing next meeting content.</p>"
             
             if nextmeeting_data:
@@ -181,47 +359,220 @@ class WebsiteBuilder:
         nextmeeting_dir = self.dist_dir / 'nextmeeting'
         nextmeeting_dir.mkdir(exist_ok=True)
         
-        template = self.jinja_env.get_template('pages/nextmeeting.html')
-        html_content = template.render(
-            site=self.site_config,
+        self.page_builder.build_page(
+            'pages/nextmeeting.html',
+            'nextmeeting/index.html',
             hero=hero_content,
             nextmeeting_content=nextmeeting_content
         )
-        
-        output_file = nextmeeting_dir / 'index.html'
-        output_file.write_text(html_content, encoding='utf-8')
         print("Built nextmeeting/index.html")
     
+    def build_search_index(self):
+        """Build the JSON index used by the client-side search."""
+        files = [path for content_type in self.content_types.values()
+                 for path in self.content_manager.content_files(content_type)]
+        if not self.is_stale(SEARCH_INDEX_FILE, [], files):
+            print(f"{SEARCH_INDEX_FILE} is up to date")
+            return
+        
+        index = SearchIndex()
+        for post in self.content_manager.get_all_content(self.content_types['news']):
+            index.add(f"news/{post['id']}.html", post['title'], post['excerpt'],
+                      item_tags(post), 'News')
+        for project in self.content_manager.get_all_content(self.content_types['projects']):
+            status = project['metadata'].get('status')
+            index.add(f"projects/{project['id']}.html", project['title'], project['excerpt'],
+                      [*item_tags(project), *([status] if status else [])], 'Project')
+        for member in self.content_manager.get_all_content(self.content_types['members']):
+            index.add(f"members/{member['id']}.html", member['title'],
+                      member['metadata'].get('role', ''), member['metadata'].get('skills') or [],
+                      'Member')
+        
+        self.page_builder.write_output(self.dist_dir / SEARCH_INDEX_FILE, index.to_json())
+        print(f"Built {SEARCH_INDEX_FILE} with {len(index.entries)} entries")
+    
+    def set_pool(self, pool):
+        """Hand the worker pool (or None) to every component that can use it."""
+        self.content_manager.pool = pool
+        self.page_builder.pool = pool
+        self.asset_manager.image_pipeline.pool = pool
+    
+    def open_pool(self):
+        """Start the worker processes, which later builds reuse until close_pool()."""
+        if self.pool is None:
+            cache_dir = self.markdown_cache.cache_dir if self.markdown_cache else None
+            self.pool = create_pool(self.jobs, self.content_dir, self.templates_dir, cache_dir,
+                                    self.image_index_file, self.bytecode_cache_dir)
+    
+    def close_pool(self):
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+    
+    def build_assets(self):
+        """Copy static assets and generate derived ones."""
+        with self.profiler.phase('copy_assets'):
+            self.asset_manager.copy_assets()
+            self.asset_manager.copy_css_files()
+        with self.profiler.phase('optimize_images'):
+            self.asset_manager.optimize_images()
+        
+        # Generate syntax highlighting CSS
+        with self.profiler.phase('syntax_css'):
+            self.asset_manager.generate_pygments_css('default')
+    
+    def build_pages(self):
+        """Build every page of the site."""
+        pages = [
+            ('index', self.build_index),
+            ('news', self.build_news_page),
+            ('projects', self.build_projects_page),
+            ('members', self.build_members_page),
+            ('about', self.build_about_page),
+            ('nextmeeting', self.build_nextmeeting_page),
+            ('search', self.build_search_index),
+        ]
+        for name, build_page in pages:
+            with self.profiler.phase(f'pages:{name}'):
+                build_page()
+    
     def build(self):
         """Main build function."""
         print("Building Boston Robot Hackers website...")
         print("Using modular design")
         
-        # Clean output directory for fresh build
-        self.asset_manager.clean_output_directory()
-        
-        # Copy static assets
-        self.asset_manager.copy_assets()
-        self.asset_manager.copy_css_files()
+        self.profiler.reset()
+        self.manifest.load()
+        # Template references are re-read from the manifest, keyed by template hash
+        self.template_deps.clear()
+        self.content_manager.refresh()
+        self.rebuilt_outputs = []
+        self.pending_outputs = {}
+        self.page_builder.written.clear()
+        if self.jobs > 1:
+            print(f"Using {self.jobs} worker processes")
+        if self.incremental:
+            print("Incremental build: only changed pages will be rebuilt")
+        else:
+            # Clean output directory for fresh build
+            with self.profiler.phase('clean'):
+                self.asset_manager.clean_output_directory()
         
-        # Generate syntax highlighting CSS
-        self.asset_manager.generate_pygments_css('default')
+        # Share one worker pool between images and pages when running in parallel;
+        # a pool opened beforehand is reused, otherwise it lasts for this build only
+        owns_pool = self.pool is None
+        self.open_pool()
+        self.set_pool(self.pool)
+        try:
+            self.build_assets()
+            self.build_pages()
+        finally:
+            self.set_pool(None)
+            if owns_pool:
+                self.close_pool()
         
-        # Build pages
-        self.build_index()
-        self.build_news_page()
-        self.build_projects_page()
-        self.build_members_page()
-        self.build_about_page()
-        self.build_nextmeeting_page()
+        with self.profiler.phase('finalize'):
+            self.finalize()
         
         print("Build complete!")
+        if self.profile_file is not None:
+            print(self.profiler.summary())
+            self.profiler.write_json(self.profile_file)
+            print(f"Wrote build profile to {self.profile_file}")
+    
+    def record_outputs(self) -> List[str]:
+        """Record the inputs of every stale output that was written.
+        
+        Stale outputs that were not written (their item failed to load)
+        are deleted rather than left behind looking up to date.
+        """
+        removed = []
+        for output_name, inputs in self.pending_outputs.items():
+            output_file = self.dist_dir / output_name
+            if output_file in self.page_builder.written:
+                self.manifest.record(output_file, inputs)
+                self.rebuilt_outputs.append(output_name)
+            elif output_file.exists():
+                output_file.unlink()
+                removed.append(output_name)
+        return removed
+    
+    def finalize(self):
+        """Prune stale outputs and persist the manifest and caches."""
+        for removed in self.record_outputs():
+            print(f"Removed output that was not rebuilt: {removed}")
+        if self.incremental:
+            for removed in self.manifest.prune_stale_outputs():
+                print(f"Removed stale output {removed}")
+        self.manifest.save()
+        if self.markdown_cache:
+            evicted = self.markdown_cache.evict()
+            if evicted:
+                print(f"Evicted {evicted} old entries from the markdown cache")
+    
+    def rebuild(self, changed_paths: Iterable[Path]):
+        """Incrementally rebuild a warm builder after the given files changed.
+        
+        The changed files are dropped from memory explicitly: their mtime and
+        size may look unchanged while the manifest sees a new content hash.
+        """
+        changed = {path.resolve() for path in changed_paths}
+        self.content_manager.invalidate(changed)
+        if any(self.templates_dir.resolve() in path.parents for path in changed):
+            # Compiled templates are also reused by mtime alone, here and in the workers
+            self.jinja_env.cache.clear()
+            if self.pool is not None:
+                self.close_pool()
+                self.open_pool()
+        if (self.config_dir / "site.json").resolve() in changed:
+            self.site_config = self.load_site_config()
+            self.page_builder.site_config = self.site_config
+        self.incremental = True
+        self.build()
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description="Build the Boston Robot Hackers website.")
+    parser.add_argument('command', nargs='?', choices=['build', 'serve'], default='build',
+                        help="build the site once (default) or build and serve it locally")
+    parser.add_argument('--incremental', action='store_true',
+                        help="only rebuild pages whose inputs changed since the last build")
+    parser.add_argument('-j', '--jobs', type=int, default=1, metavar='N',
+                        help="parse markdown and render detail pages with N worker processes")
+    parser.add_argument('--no-cache', dest='use_cache', action='store_false',
+                        help="render all markdown and compile all templates without the "
+                             "markdown and template caches (the manifest and image variants "
+                             "in .build-cache are still used)")
+    parser.add_argument('--profile', action='store_true',
+                        help="print phase and per-file timings and write them as JSON "
+                             "to .build-cache/profile.json")
+    parser.add_argument('--profile-json', metavar='PATH',
+                        help="write the profile JSON to PATH instead (implies --profile)")
+    parser.add_argument('--cprofile', metavar='PATH',
+                        help="also run the build under cProfile and dump pstats to PATH")
+    parser.add_argument('--watch', action='store_true',
+                        help="with serve: rebuild changed pages and live-reload open browsers")
+    parser.add_argument('--host', default='127.0.0.1', help="with serve: address to bind")
+    parser.add_argument('--port', type=int, default=8000, help="with serve: port to listen on")
+    return parser.parse_args(argv)
 
 
-def main():
+def main(argv=None):
     """Main entry point."""
-    builder = WebsiteBuilder()
-    builder.build()
+    args = parse_args(argv)
+    serving = args.command == 'serve'
+    # An empty profile path selects the default location in the build cache
+    profile = args.profile_json or ('' if args.profile else None)
+    builder = WebsiteBuilder(incremental=args.incremental or serving, jobs=args.jobs,
+                             use_cache=args.use_cache, profile=profile)
+    if serving:
+        DevServer(builder, args.host, args.port).serve(watch=args.watch)
+    elif args.cprofile:
+        cProfile.runctx('builder.build()', globals(), {'builder': builder}, args.cprofile)
+        print(f"Wrote cProfile stats to {args.cprofile}")
+    else:
+        builder.build()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,131 @@
+"""
+Build profiling module for the website builder.
+Collects phase and per-file timings, counters and peak memory for a build.
+"""
+
+import json
+import sys
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+from jinja2 import Environment
+
+
+class BuildProfiler:
+    """Records where build time goes.
+
+    A disabled profiler (the default) turns every call into a no-op, so
+    components can be instrumented unconditionally. Timings measured in
+    worker processes (``--jobs``) are not collected; profile a serial build
+    for per-file detail.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.reset()
+
+    def reset(self):
+        """Discard everything recorded so far, e.g. between dev server rebuilds."""
+        self.started = time.perf_counter()
+        self.phases: Dict[str, float] = defaultdict(float)
+        self.counters: Dict[str, int] = defaultdict(int)
+        # category -> name -> [seconds, calls]
+        self.timings: Dict[str, Dict[str, list]] = defaultdict(lambda: defaultdict(lambda: [0.0, 0]))
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time a top-level build phase."""
+        if not self.enabled:
+            yield
+            return
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] += time.perf_counter() - started
+
+    @contextmanager
+    def timed(self, category: str, name: str):
+        """Time one unit of work, e.g. a markdown file or a template render."""
+        if not self.enabled:
+            yield
+            return
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            entry = self.timings[category][str(name)]
+            entry[0] += time.perf_counter() - started
+            entry[1] += 1
+
+    def count(self, counter: str, amount: int = 1):
+        """Increment a named counter."""
+        if self.enabled:
+            self.counters[counter] += amount
+
+    def instrument_jinja(self, jinja_env: Environment):
+        """Count and time template compilation in a Jinja environment."""
+        if not self.enabled:
+            return
+        compile_template = jinja_env.compile
+
+        def compile_and_record(source, name=None, filename=None, *args, **kwargs):
+            self.count('templates_compiled')
+            with self.timed('template_compile', name):
+                return compile_template(source, name, filename, *args, **kwargs)
+
+        jinja_env.compile = compile_and_record
+
+    @staticmethod
+    def peak_memory_kb() -> Optional[int]:
+        """Peak resident set size of this process in KiB, where the platform reports it."""
+        if resource is None:
+            return None
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # macOS reports bytes, Linux reports kilobytes
+        return peak // 1024 if sys.platform == 'darwin' else peak
+
+    def report(self) -> Dict[str, Any]:
+        """Structured profile of the build so far."""
+        files = {}
+        for category, entries in self.timings.items():
+            ranked = sorted(entries.items(), key=lambda item: item[1][0], reverse=True)
+            files[category] = [{'name': name, 'seconds': round(seconds, 6), 'calls': calls}
+                               for name, (seconds, calls) in ranked]
+        return {
+            'total_seconds': round(time.perf_counter() - self.started, 6),
+            'phases': {name: round(seconds, 6) for name, seconds in self.phases.items()},
+            'counters': dict(self.counters),
+            'peak_memory_kb': self.peak_memory_kb(),
+            'timings': files,
+        }
+
+    def summary(self, top: int = 5) -> str:
+        """Human-readable version of report()."""
+        report = self.report()
+        lines = [f"Build profile: {report['total_seconds']:.3f}s total"]
+        for name, seconds in report['phases'].items():
+            lines.append(f"  {name:<24} {seconds * 1000:9.1f} ms")
+        for name, value in sorted(report['counters'].items()):
+            lines.append(f"  {name:<24} {value:>9}")
+        if report['peak_memory_kb'] is not None:
+            lines.append(f"  {'peak_memory':<24} {report['peak_memory_kb'] / 1024:9.1f} MiB")
+        for category, entries in report['timings'].items():
+            total = sum(entry['seconds'] for entry in entries)
+            lines.append(f"  slowest {category} ({len(entries)} items, {total * 1000:.1f} ms total):")
+            for entry in entries[:top]:
+                lines.append(f"    {entry['seconds'] * 1000:9.1f} ms  {entry['name']}")
+        return '\n'.join(lines)
+
+    def write_json(self, path: Path):
+        """Write the structured report to a file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.report(), indent=1))
@@ -13,9 +13,10 @@ from typing import List, Dict, Any
 
 import frontmatter
 import markdown
-from jinja2 import Environment, FileSystemLoader
 from pygments.formatters import HtmlFormatter
 
+from templating import create_jinja_environment
+
 
 class ContentType:
     """Configuration for different content types."""
@@ -51,9 +52,8 @@ class WebsiteBuilder:
         # Load configurations
         self.site_config = self.load_site_config()
         
-        # Set up Jinja2 environment
-        template_paths = [str(self.templates_dir)]
-        self.jinja_env = Environment(loader=FileSystemLoader(template_paths))
+        # Set up Jinja2 environment (shared with the modular builder's template helpers)
+        self.jinja_env = create_jinja_environment(self.templates_dir)
         
         # Define content types
         self.content_types = {
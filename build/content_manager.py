@@ -5,11 +5,25 @@ Handles loading and processing of markdown content.
 
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 
 import frontmatter
 import markdown
 
+from build_profiler import BuildProfiler
+from markdown_cache import MarkdownCache
+from pagination import slugify
+
+
+MARKDOWN_EXTENSIONS = ['codehilite', 'fenced_code', 'tables', 'toc']
+MARKDOWN_EXTENSION_CONFIGS = {
+    'codehilite': {
+        'css_class': 'highlight',
+        'use_pygments': True,
+        'noclasses': False,
+    }
+}
+
 
 class ContentType:
     """Configuration for different content types."""
@@ -25,34 +39,80 @@ class ContentType:
         self.output_filename = output_filename or f'{name}.html'
 
 
+def item_tags(item: Dict[str, Any]) -> List[str]:
+    """Tags from an item's front matter, given as a list or a comma-separated string.
+
+    A single other value, like ``tags: 2025``, is used as one tag. Tags
+    sharing an archive page, like "ROS" and "ros", are kept once.
+    """
+    tags = item['metadata'].get('tags') or []
+    if isinstance(tags, str):
+        tags = tags.split(',')
+    elif not isinstance(tags, (list, tuple)):
+        tags = [tags]
+    unique = {}
+    for tag in (str(tag).strip() for tag in tags):
+        if tag:
+            unique.setdefault(slugify(tag), tag)
+    return list(unique.values())
+
+
 class ContentManager:
     """Manages content loading and processing."""
     
-    def __init__(self, content_dir: Path):
+    def __init__(self, content_dir: Path, cache: Optional[MarkdownCache] = None,
+                 profiler: Optional[BuildProfiler] = None):
         self.content_dir = content_dir
+        self.cache = cache
+        self.profiler = profiler or BuildProfiler()
+        self._md_processor = None
+    
+    @staticmethod
+    def markdown_config() -> Dict[str, Any]:
+        """Markdown settings that affect rendered HTML, used for cache keys."""
+        return {'extensions': MARKDOWN_EXTENSIONS, 'extension_configs': MARKDOWN_EXTENSION_CONFIGS}
     
     def setup_markdown_processor(self):
         """Set up markdown processor with syntax highlighting."""
+        self.profiler.count('markdown_instances')
         return markdown.Markdown(
-            extensions=['codehilite', 'fenced_code', 'tables', 'toc'],
-            extension_configs={
-                'codehilite': {
-                    'css_class': 'highlight',
-                    'use_pygments': True,
-                    'noclasses': False,
-                }
-            }
+            extensions=MARKDOWN_EXTENSIONS,
+            extension_configs=MARKDOWN_EXTENSION_CONFIGS
         )
     
+    @property
+    def md_processor(self):
+        """Markdown processor shared by every file, created on first use."""
+        if self._md_processor is None:
+            self._md_processor = self.setup_markdown_processor()
+        return self._md_processor
+    
+    def parse_markdown_file(self, file_path: Path, md_processor) -> Tuple[Dict[str, Any], str]:
+        """Return front matter and rendered HTML, from the cache when possible."""
+        key = self.cache.key(file_path.read_bytes()) if self.cache else None
+        if key:
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.profiler.count('markdown_cache_hits')
+                return cached
+            self.profiler.count('markdown_cache_misses')
+        
+        with self.profiler.timed('frontmatter', file_path):
+            post = frontmatter.load(file_path)
+        with self.profiler.timed('markdown', file_path):
+            html_content = md_processor.reset().convert(post.content)
+        self.profiler.count('markdown_files_converted')
+        if key:
+            self.cache.put(key, post.metadata, html_content)
+        return post.metadata, html_content
+    
     def process_markdown_file(self, file_path: Path, md_processor=None) -> Dict[str, Any]:
         """Process a single markdown file and return structured data."""
         if md_processor is None:
-            md_processor = self.setup_markdown_processor()
+            md_processor = self.md_processor
             
         try:
-            post = frontmatter.load(file_path)
-            html_content = md_processor.convert(post.content)
-            metadata = post.metadata
+            metadata, html_content = self.parse_markdown_file(file_path, md_processor)
             
             # Parse date from filename if not in front matter
             if 'date' not in metadata:
@@ -81,6 +141,21 @@ class ContentManager:
             print(f"Error processing {file_path}: {e}")
             return None
     
+    def load_file(self, file_path: Path) -> Optional[Dict[str, Any]]:
+        """Load a content file; the single entry point for reading markdown."""
+        return self.process_markdown_file(file_path)
+    
+    def content_files(self, content_type: ContentType) -> List[Path]:
+        """List the markdown source files of a given content type."""
+        content_dir = self.content_dir / content_type.directory
+        if not content_dir.exists():
+            return []
+        return list(content_dir.glob('*.md'))
+    
+    def hero_file(self, page_name: str = 'index') -> Path:
+        """Path of the hero markdown file for a page."""
+        return self.content_dir / 'heroes' / f'{page_name}.md'
+    
     def get_all_content(self, content_type: ContentType) -> List[Dict[str, Any]]:
         """Generic method to get all content of a given type."""
         content_dir = self.content_dir / content_type.directory
@@ -88,11 +163,10 @@ class ContentManager:
             print(f"Warning: {content_dir} directory not found")
             return []
         
-        md_processor = self.setup_markdown_processor()
         items = []
         
-        for md_file in content_dir.glob('*.md'):
-            item_data = self.process_markdown_file(md_file, md_processor)
+        for md_file in self.content_files(content_type):
+            item_data = self.load_file(md_file)
             if item_data:
                 items.append(item_data)
         
@@ -102,13 +176,12 @@ class ContentManager:
     
     def build_hero_content(self, page_name: str = 'index') -> Dict[str, Any]:
         """Build hero content from page-specific markdown file."""
-        hero_file = self.content_dir / 'heroes' / f'{page_name}.md'
+        hero_file = self.hero_file(page_name)
         if not hero_file.exists():
             print(f"Warning: {hero_file} not found, leaving hero section blank")
             return {'hero_title': '', 'hero_subtitle': '', 'hero_content': ''}
         
-        md_processor = self.setup_markdown_processor()
-        hero_data = self.process_markdown_file(hero_file, md_processor)
+        hero_data = self.load_file(hero_file)
         
         if hero_data:
             return {
@@ -127,6 +200,5 @@ class ContentManager:
             print(f"Warning: {content_file} not found")
             return f"<p>{filename} content not found.</p>"
         
-        md_processor = self.setup_markdown_processor()
-        content_data = self.process_markdown_file(content_file, md_processor)
+        content_data = self.load_file(content_file)
         return content_data['content'] if content_data else f"<p>Error processing {filename} content.</p>"
\ No newline at end of file
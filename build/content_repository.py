@@ -0,0 +1,115 @@
+"""
+Content repository module for the website builder.
+Loads each content file once and serves sorted and filtered views from memory.
+"""
+
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from content_manager import ContentManager, ContentType, item_tags
+from build_profiler import BuildProfiler
+from markdown_cache import MarkdownCache
+from pagination import slugify
+from parallel_build import load_content_file, run_reporting_errors
+
+
+class ContentRepository(ContentManager):
+    """Content manager that parses each markdown file at most once.
+
+    Loaded items are kept in memory keyed by path and reused for as long as
+    the file's size and modification time are unchanged, so every page
+    builder shares the same parsed data. When a worker ``pool`` is set,
+    files that still need converting are parsed in parallel.
+    """
+
+    def __init__(self, content_dir: Path, cache: Optional[MarkdownCache] = None,
+                 profiler: Optional[BuildProfiler] = None):
+        super().__init__(content_dir, cache, profiler)
+        self._items: Dict[Path, Tuple[Tuple[int, int], Optional[Dict[str, Any]]]] = {}
+        self._views: Dict[str, List[Dict[str, Any]]] = {}
+        self.pool = None
+
+    def refresh(self):
+        """Start a new build: drop cached views so directory listings are re-read."""
+        self._views.clear()
+
+    def invalidate(self, paths: Iterable[Path]):
+        """Forget loaded items for the given paths, even if their signature looks unchanged.
+
+        A same-size edit within one mtime tick keeps the signature, so callers
+        that know which files changed use this to force them to be parsed again.
+        """
+        changed = {Path(path).resolve() for path in paths}
+        for loaded in [path for path in self._items if path.resolve() in changed]:
+            del self._items[loaded]
+        self._views.clear()
+
+    @staticmethod
+    def _signature(file_path: Path) -> Optional[Tuple[int, int]]:
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _is_loaded(self, file_path: Path, signature) -> bool:
+        cached = self._items.get(file_path)
+        return cached is not None and cached[0] == signature
+
+    def load_file(self, file_path: Path) -> Optional[Dict[str, Any]]:
+        """Return the parsed file, converting it only if it changed on disk."""
+        signature = self._signature(file_path)
+        if not self._is_loaded(file_path, signature):
+            self._items[file_path] = (signature, super().load_file(file_path))
+        return self._items[file_path][1]
+
+    def preload(self, files: List[Path]):
+        """Convert files that are not loaded yet using the worker pool."""
+        if self.pool is None:
+            return
+        signatures = {path: self._signature(path) for path in files}
+        pending = [path for path in files if not self._is_loaded(path, signatures[path])]
+        if len(pending) < 2:
+            return
+        results = run_reporting_errors(self.pool, load_content_file,
+                                       [(str(path),) for path in pending], pending)
+        for path, item in zip(pending, results):
+            self._items[path] = (signatures[path], item)
+
+    def get_all_content(self, content_type: ContentType) -> List[Dict[str, Any]]:
+        """All items of a content type, sorted as configured on the type."""
+        if content_type.name not in self._views:
+            self.preload(self.content_files(content_type))
+            self._views[content_type.name] = super().get_all_content(content_type)
+        return self._views[content_type.name]
+
+    def filter(self, content_type: ContentType,
+               predicate: Callable[[Dict[str, Any]], bool]) -> List[Dict[str, Any]]:
+        """Items of a content type matching a predicate, in sorted order."""
+        return [item for item in self.get_all_content(content_type) if predicate(item)]
+
+    def highlighted(self, content_type: ContentType) -> List[Dict[str, Any]]:
+        """Items flagged with ``highlight: true`` in their front matter."""
+        return self.filter(content_type, lambda item: item['metadata'].get('highlight', False))
+
+    def by_tag(self, content_type: ContentType) -> Dict[str, List[Dict[str, Any]]]:
+        """Items grouped by each of their tags, in sorted order within a tag.
+
+        Tags are grouped by their slug, the name of their archive page, so
+        "ROS" and "ros" share one group under the first spelling seen.
+        """
+        names, groups = {}, defaultdict(list)
+        for item in self.get_all_content(content_type):
+            for tag in item_tags(item):
+                names.setdefault(slugify(tag), tag)
+                groups[slugify(tag)].append(item)
+        return {names[slug]: items for slug, items in groups.items()}
+
+    def by_year(self, content_type: ContentType) -> Dict[str, List[Dict[str, Any]]]:
+        """Items grouped by the year of their date."""
+        groups = defaultdict(list)
+        for item in self.get_all_content(content_type):
+            if item['date']:
+                groups[str(item['date'])[:4]].append(item)
+        return dict(groups)
@@ -0,0 +1,232 @@
+"""
+Development server module for the website builder.
+Serves the output directory, rebuilds on file changes and live-reloads open pages.
+"""
+
+import json
+import threading
+import time
+import traceback
+from concurrent.futures import BrokenExecutor
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+LIVERELOAD_PATH = '/__livereload'
+
+# Injected into every served HTML page; reloads when the page or a shared asset changed
+LIVERELOAD_SCRIPT = """
+<script>
+(function () {
+  var source = new EventSource('%s');
+  source.onmessage = function (event) {
+    var change = JSON.parse(event.data);
+    var page = location.pathname.replace(/^\\//, '');
+    if (page === '' || page.endsWith('/')) { page += 'index.html'; }
+    if (change.assets || change.pages.indexOf(decodeURIComponent(page)) !== -1) {
+      location.reload();
+    }
+  };
+})();
+</script>
+""" % LIVERELOAD_PATH
+
+
+class FileWatcher:
+    """Polls directory trees for added, removed and modified files."""
+
+    def __init__(self, directories: Iterable[Path], interval: float = 0.2):
+        self.directories = list(directories)
+        self.interval = interval
+        self._state = self.snapshot()
+
+    def snapshot(self) -> Dict[Path, Tuple[int, int]]:
+        state = {}
+        for directory in self.directories:
+            if not directory.exists():
+                continue
+            for path in directory.rglob('*'):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                if not path.is_dir():
+                    state[path] = (stat.st_mtime_ns, stat.st_size)
+        return state
+
+    def poll(self) -> Set[Path]:
+        """Return the files that changed since the previous poll."""
+        state = self.snapshot()
+        changed = {path for path in state.keys() | self._state.keys()
+                   if state.get(path) != self._state.get(path)}
+        self._state = state
+        return changed
+
+    def wait_for_changes(self) -> Set[Path]:
+        """Block until something changes, then until the burst of writes settles."""
+        changed = set()
+        while not changed:
+            time.sleep(self.interval)
+            changed = self.poll()
+        while True:
+            time.sleep(self.interval / 2)
+            more = self.poll()
+            if not more:
+                return changed
+            changed |= more
+
+
+class ReloadBroadcaster:
+    """Hands the latest rebuild summary to every waiting live-reload connection."""
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self.version = 0
+        self.message = ''
+
+    def publish(self, pages: List[str], assets: bool):
+        with self._condition:
+            self.version += 1
+            self.message = json.dumps({'pages': pages, 'assets': assets})
+            self._condition.notify_all()
+
+    def wait(self, seen_version: int, timeout: float) -> Tuple[int, Optional[str]]:
+        with self._condition:
+            self._condition.wait_for(lambda: self.version != seen_version, timeout)
+            if self.version == seen_version:
+                return seen_version, None
+            return self.version, self.message
+
+
+class DevRequestHandler(SimpleHTTPRequestHandler):
+    """Static file handler that disables caching and injects the reload script."""
+
+    broadcaster: ReloadBroadcaster = None
+
+    def log_request(self, code='-', size='-'):
+        # Keep the terminal for build output; errors are still logged by log_error()
+        pass
+
+    def end_headers(self):
+        self.send_header('Cache-Control', 'no-store')
+        super().end_headers()
+
+    def do_GET(self):
+        if self.path == LIVERELOAD_PATH:
+            self.stream_reload_events()
+            return
+        path = Path(self.translate_path(self.path))
+        if path.is_dir():
+            path = path / 'index.html'
+        if path.suffix == '.html' and path.is_file():
+            self.send_html(path)
+            return
+        super().do_GET()
+
+    def send_html(self, path: Path):
+        html = path.read_text(encoding='utf-8')
+        if '</body>' in html:
+            html = html.replace('</body>', LIVERELOAD_SCRIPT + '</body>', 1)
+        else:
+            html += LIVERELOAD_SCRIPT
+        body = html.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def stream_reload_events(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.end_headers()
+        version = self.broadcaster.version
+        try:
+            while True:
+                version, message = self.broadcaster.wait(version, timeout=15)
+                # A comment line doubles as a keep-alive that detects closed tabs
+                self.wfile.write(f"data: {message}\n\n".encode() if message else b": ping\n\n")
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            return
+
+
+class DevServer:
+    """Keeps a WebsiteBuilder warm, rebuilding and reloading pages as files change."""
+
+    WATCHED_DIRECTORIES = ("content", "templates", "config", "css", "images", "scripts")
+    ASSET_DIRECTORIES = ("css", "images", "scripts")
+
+    def __init__(self, builder, host: str = '127.0.0.1', port: int = 8000):
+        self.builder = builder
+        self.host = host
+        self.port = port
+        self.broadcaster = ReloadBroadcaster()
+
+    def create_server(self) -> ThreadingHTTPServer:
+        handler = type('Handler', (DevRequestHandler,), {'broadcaster': self.broadcaster})
+        server = ThreadingHTTPServer((self.host, self.port),
+                                     partial(handler, directory=str(self.builder.dist_dir)))
+        server.daemon_threads = True
+        return server
+
+    def is_asset(self, path: Path) -> bool:
+        root = self.builder.root_dir.resolve()
+        try:
+            top = path.resolve().relative_to(root).parts[0]
+        except (ValueError, IndexError):
+            return False
+        return top in self.ASSET_DIRECTORIES
+
+    def rebuild(self, changed: Set[Path]):
+        """Rebuild after a change and tell open pages what was affected."""
+        started = time.perf_counter()
+        try:
+            self.builder.rebuild(changed)
+        except Exception as e:
+            # Keep serving: a broken template or front matter is fixed by the next save
+            traceback.print_exc()
+            if isinstance(e, BrokenExecutor):
+                # A worker died; start fresh ones for the next rebuild
+                self.builder.close_pool()
+                self.builder.open_pool()
+            return
+        elapsed = (time.perf_counter() - started) * 1000
+        pages = self.builder.rebuilt_outputs
+        assets = any(self.is_asset(path) for path in changed)
+        print(f"Rebuilt {len(pages)} pages in {elapsed:.0f} ms")
+        self.broadcaster.publish(pages, assets)
+
+    def watch(self):
+        directories = [self.builder.root_dir / name for name in self.WATCHED_DIRECTORIES]
+        watcher = FileWatcher(directories)
+        while True:
+            changed = watcher.wait_for_changes()
+            names = ', '.join(sorted(str(path) for path in changed)[:5])
+            print(f"Detected changes: {names}{' ...' if len(changed) > 5 else ''}")
+            self.rebuild(changed)
+
+    def serve(self, watch: bool = False):
+        """Build once, then serve the output directory until interrupted.
+
+        With --jobs the worker processes are started once here and reused by
+        every rebuild, so a save does not pay their startup again.
+        """
+        self.builder.open_pool()
+        try:
+            self.builder.build()
+            server = self.create_server()
+            if watch:
+                threading.Thread(target=self.watch, daemon=True).start()
+            print(f"Serving {self.builder.dist_dir} at http://{self.host}:{self.port}/"
+                  + (" (watching for changes)" if watch else ""))
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                print("Stopping server")
+            finally:
+                server.server_close()
+        finally:
+            self.builder.close_pool()
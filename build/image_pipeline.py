@@ -0,0 +1,211 @@
+"""
+Image pipeline module for the website builder.
+Builds resized and recompressed variants (including WebP) of the site images.
+"""
+
+import hashlib
+import json
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:
+    from PIL import Image, ImageOps
+    import PIL
+except ImportError:  # Pillow is optional; templates fall back to the originals
+    Image = None
+
+from asset_sync import AssetSync
+from parallel_build import run_reporting_errors
+
+
+PIPELINE_VERSION = 1
+VARIANT_WIDTHS = (320, 640, 1280)
+SOURCE_FORMATS = {'.jpg': 'JPEG', '.jpeg': 'JPEG', '.png': 'PNG'}
+SAVE_OPTIONS = {
+    'JPEG': {'quality': 82, 'optimize': True, 'progressive': True},
+    'PNG': {'optimize': True},
+    'WEBP': {'quality': 80, 'method': 4},
+}
+
+
+def target_widths(original_width: int, widths=VARIANT_WIDTHS) -> List[int]:
+    """Variant widths for an image: every smaller size plus one capped at the largest."""
+    sizes = [width for width in widths if width < original_width]
+    sizes.append(min(original_width, widths[-1]))
+    return sorted(set(sizes))
+
+
+def _save(image, path: Path, image_format: str):
+    if image_format == 'JPEG' and image.mode not in ('RGB', 'L'):
+        image = image.convert('RGB')
+    elif image_format == 'WEBP' and image.mode not in ('RGB', 'RGBA'):
+        has_alpha = image.mode in ('LA', 'PA') or 'transparency' in image.info
+        image = image.convert('RGBA' if has_alpha else 'RGB')
+    image.save(path, image_format, **SAVE_OPTIONS[image_format])
+
+
+def render_variants(source: str, entry_dir: str) -> Dict[str, Any]:
+    """Write every variant of one image into a cache entry; safe to run in a worker."""
+    source_path, entry_path = Path(source), Path(entry_dir)
+    suffix = source_path.suffix.lower()
+    image_format = SOURCE_FORMATS[suffix]
+    # Build in a scratch directory and rename, so readers never see a partial entry
+    scratch = Path(tempfile.mkdtemp(dir=entry_path.parent, prefix='.tmp-'))
+    try:
+        with Image.open(source_path) as original:
+            image = ImageOps.exif_transpose(original)
+            variants = []
+            for width in target_widths(image.width):
+                height = max(1, round(image.height * width / image.width))
+                if width == image.width:
+                    # Full size: the original already serves as the fallback format
+                    _save(image, scratch / f"{width}.webp", 'WEBP')
+                    variants.append({'width': width, 'height': height, 'original': True})
+                    continue
+                resized = image.resize((width, height), Image.LANCZOS)
+                _save(resized, scratch / f"{width}{suffix}", image_format)
+                _save(resized, scratch / f"{width}.webp", 'WEBP')
+                variants.append({'width': width, 'height': height})
+        info = {'width': image.width, 'height': image.height, 'suffix': suffix, 'variants': variants}
+        (scratch / 'info.json').write_text(json.dumps(info))
+        try:
+            scratch.rename(entry_path)
+        except OSError:
+            # Another process finished the same entry first
+            pass
+        return info
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+
+class ImagePipeline:
+    """Generates cached responsive variants of every raster image under images/.
+
+    Variants live in the cache keyed by the source file's hash and the
+    pipeline settings, so an image is only re-encoded when it changes.
+    They are synced into ``output/variants/`` and described in an index
+    that the ``responsive_image`` template helper reads.
+    """
+
+    def __init__(self, root_dir: Path, dist_dir: Path, cache_dir: Path):
+        self.root_dir = root_dir
+        self.source_dir = root_dir / "images"
+        self.variants_dir = dist_dir / "variants"
+        self.cache_dir = cache_dir
+        self.entries_dir = cache_dir / "entries"
+        self.index_file = cache_dir / "index.json"
+        self.sources_file = cache_dir / "sources.json"
+        self.sync = AssetSync()
+        # Optional worker pool for encoding images in parallel
+        self.pool = None
+
+    @staticmethod
+    def settings_fingerprint() -> str:
+        settings = [PIPELINE_VERSION, VARIANT_WIDTHS, SAVE_OPTIONS, PIL.__version__]
+        return hashlib.sha256(json.dumps(settings, sort_keys=True).encode('utf-8')).hexdigest()
+
+    def find_sources(self) -> List[Path]:
+        if not self.source_dir.exists():
+            return []
+        return sorted(path for path in self.source_dir.rglob('*')
+                      if path.suffix.lower() in SOURCE_FORMATS and path.is_file())
+
+    def source_keys(self, sources: List[Path]) -> Dict[Path, str]:
+        """Cache keys per source, re-hashing only files whose size or mtime changed."""
+        try:
+            known = json.loads(self.sources_file.read_text())
+        except (OSError, ValueError):
+            known = {}
+        fingerprint = self.settings_fingerprint()
+        keys, seen = {}, {}
+        for source in sources:
+            name = source.relative_to(self.root_dir).as_posix()
+            stat = source.stat()
+            signature = [stat.st_mtime_ns, stat.st_size]
+            digest = known.get(name, {}).get('sha256')
+            if known.get(name, {}).get('signature') != signature or digest is None:
+                digest = hashlib.sha256(source.read_bytes()).hexdigest()
+            seen[name] = {'signature': signature, 'sha256': digest}
+            keys[source] = hashlib.sha256(f"{fingerprint}:{digest}".encode('ascii')).hexdigest()
+        if seen != known:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self.sources_file.write_text(json.dumps(seen, indent=1, sort_keys=True))
+        return keys
+
+    def render_missing(self, keys: Dict[Path, str]) -> int:
+        """Encode variants for sources that have no cache entry yet."""
+        missing = [source for source, key in keys.items()
+                   if not (self.entries_dir / key / 'info.json').exists()]
+        if not missing:
+            return 0
+        self.entries_dir.mkdir(parents=True, exist_ok=True)
+        calls = [(str(source), str(self.entries_dir / keys[source])) for source in missing]
+        results = run_reporting_errors(self.pool, render_variants, calls, missing)
+        return sum(1 for result in results if result is not None)
+
+    def _load_info(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            return json.loads((self.entries_dir / key / 'info.json').read_text())
+        except (OSError, ValueError):
+            return None
+
+    def publish(self, keys: Dict[Path, str]) -> Dict[str, Any]:
+        """Sync cached variants into the output tree and build the template index."""
+        index, wanted = {}, set()
+        for source, key in keys.items():
+            info = self._load_info(key)
+            if info is None:
+                continue
+            name = source.relative_to(self.root_dir).as_posix()
+            # Keep the source suffix so photo.png and photo.jpg publish distinct variants
+            stem = source.relative_to(self.source_dir).as_posix()
+            variants = []
+            for variant in info['variants']:
+                width = variant['width']
+                files = {'webp': (f"{stem}-{width}.webp", f"{width}.webp")}
+                if not variant.get('original'):
+                    files['src'] = (f"{stem}-{width}{info['suffix']}", f"{width}{info['suffix']}")
+                urls = {'src': name}
+                for kind, (published, cached) in files.items():
+                    self.sync.sync_file(self.entries_dir / key / cached, self.variants_dir / published)
+                    wanted.add(Path(published))
+                    urls[kind] = f"variants/{published}"
+                variants.append({'width': width, 'height': variant['height'], **urls})
+            index[name] = {'width': info['width'], 'height': info['height'], 'variants': variants}
+        if self.variants_dir.exists():
+            self.sync.prune(self.variants_dir, wanted)
+        return index
+
+    def write_index(self, index: Dict[str, Any]):
+        """Write the index only when it changed, so pages depending on it stay fresh."""
+        content = json.dumps(index, indent=1, sort_keys=True)
+        if self.index_file.exists() and self.index_file.read_text() == content:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.index_file.write_text(content)
+
+    def evict_unused(self, keys: Dict[Path, str]) -> int:
+        """Drop cache entries for images that no longer exist or changed."""
+        if not self.entries_dir.exists():
+            return 0
+        current = set(keys.values())
+        removed = 0
+        for entry in self.entries_dir.iterdir():
+            if entry.name not in current:
+                shutil.rmtree(entry, ignore_errors=True)
+                removed += 1
+        return removed
+
+    def run(self) -> Dict[str, int]:
+        """Bring all image variants and the template index up to date."""
+        if Image is None:
+            print("Warning: Pillow is not installed, skipping responsive image variants")
+            self.write_index({})
+            return {'images': 0, 'encoded': 0, 'evicted': 0}
+        keys = self.source_keys(self.find_sources())
+        encoded = self.render_missing(keys)
+        self.write_index(self.publish(keys))
+        evicted = self.evict_unused(keys)
+        return {'images': len(keys), 'encoded': encoded, 'evicted': evicted}
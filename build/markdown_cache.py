@@ -0,0 +1,112 @@
+"""
+Markdown cache module for the website builder.
+Persists parsed front matter and rendered HTML between builds.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import markdown
+import pygments
+
+
+CACHE_FORMAT_VERSION = 1
+DEFAULT_MAX_BYTES = 128 * 1024 * 1024
+
+
+class MarkdownCache:
+    """Content-addressed, size-bounded on-disk cache of rendered markdown.
+
+    Entries are keyed by the source bytes plus a fingerprint of the markdown
+    configuration and library versions, so editing a file, changing an
+    extension option or upgrading Markdown/Pygments naturally misses the
+    cache. Least recently used entries are evicted once the cache grows
+    past ``max_bytes``.
+    """
+
+    def __init__(self, cache_dir: Path, markdown_config: Dict[str, Any],
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.fingerprint = self.config_fingerprint(markdown_config)
+
+    @staticmethod
+    def config_fingerprint(markdown_config: Dict[str, Any]) -> str:
+        """Hash the settings and library versions that affect rendered output."""
+        settings = {
+            'format': CACHE_FORMAT_VERSION,
+            'markdown_config': markdown_config,
+            'markdown': markdown.__version__,
+            'pygments': pygments.__version__,
+            'frontmatter': metadata.version('python-frontmatter'),
+        }
+        encoded = json.dumps(settings, sort_keys=True, default=str).encode('utf-8')
+        return hashlib.sha256(encoded).hexdigest()
+
+    def key(self, source: bytes) -> str:
+        """Cache key for the raw bytes of a markdown file."""
+        digest = hashlib.sha256(self.fingerprint.encode('ascii'))
+        digest.update(source)
+        return digest.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.pickle"
+
+    def get(self, key: str) -> Optional[Tuple[Dict[str, Any], str]]:
+        """Return cached ``(front_matter, html)`` for a key, or None on a miss."""
+        entry = self._entry_path(key)
+        try:
+            with entry.open('rb') as f:
+                value = pickle.load(f)
+            # Bump the modification time so eviction sees this entry as recently used
+            os.utime(entry)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Warning: discarding unreadable cache entry {entry}: {e}")
+            entry.unlink(missing_ok=True)
+            return None
+        return value
+
+    def put(self, key: str, front_matter: Dict[str, Any], html_content: str):
+        """Store an entry, writing atomically so parallel workers can share the cache."""
+        entry = self._entry_path(key)
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=entry.parent, suffix='.tmp')
+        except OSError as e:
+            print(f"Warning: could not write cache entry {entry}: {e}")
+            return
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump((front_matter, html_content), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, entry)
+        except Exception as e:
+            # A failed cache write only costs a re-render next time
+            Path(tmp_name).unlink(missing_ok=True)
+            print(f"Warning: could not write cache entry {entry}: {e}")
+
+    def evict(self) -> int:
+        """Delete least recently used entries until the cache fits; return the count removed."""
+        if not self.cache_dir.exists():
+            return 0
+        entries = []
+        total = 0
+        for entry in self.cache_dir.glob('*/*.pickle'):
+            stat = entry.stat()
+            entries.append((stat.st_mtime_ns, stat.st_size, entry))
+            total += stat.st_size
+        removed = 0
+        for _, size, entry in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        return removed
@@ -5,20 +5,44 @@ Handles template rendering and page generation.
 
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Set
 
-from jinja2 import Environment
+from jinja2 import Environment, Template
 
-from content_manager import ContentType
+from build_profiler import BuildProfiler
+from content_manager import ContentType, item_tags
+from pagination import root_prefix
+from parallel_build import render_to_file, run_all
 
 
 class PageBuilder:
     """Handles page building and template rendering."""
     
-    def __init__(self, jinja_env: Environment, dist_dir: Path, site_config: Dict):
+    def __init__(self, jinja_env: Environment, dist_dir: Path, site_config: Dict,
+                 profiler: BuildProfiler = None):
         self.jinja_env = jinja_env
         self.dist_dir = dist_dir
         self.site_config = site_config
+        self.profiler = profiler or BuildProfiler()
+        # Optional worker pool for rendering detail pages in parallel
+        self.pool = None
+        # Every file written during the current build
+        self.written: Set[Path] = set()
+        # Search index the pages link to; the search box is only shown when set
+        self.search_index: Optional[str] = None
+    
+    def render(self, template: Template, **context) -> str:
+        """Render a template, timing it per template name."""
+        with self.profiler.timed('render', template.name):
+            return template.render(**context)
+    
+    def write_output(self, output_file: Path, html_content: str):
+        """Write a generated page and account for the bytes written."""
+        with self.profiler.timed('write', output_file.relative_to(self.dist_dir)):
+            written = output_file.write_text(html_content, encoding='utf-8')
+        self.written.add(output_file)
+        self.profiler.count('pages_written')
+        self.profiler.count('bytes_written', written)
     
     def format_date(self, date_str: str) -> str:
         """Format date string for display."""
@@ -45,7 +69,9 @@ class PageBuilder:
             'projects': 'project', 
             'members': 'member'
         }
+        var_name = template_var_map.get(content_type.name, content_type.name[:-1])
         
+        pages = []
         for item in items:
             # Format date if it exists
             item_with_formatted_date = item.copy()
@@ -53,15 +79,24 @@ class PageBuilder:
                 item_with_formatted_date['date'] = self.format_date(item['date'])
             
             # Use correct variable name for templates
-            var_name = template_var_map.get(content_type.name, content_type.name[:-1])
             template_vars = {
                 'site': self.site_config,
+                'root_prefix': root_prefix(f"{content_type.directory}/{item['id']}.html"),
+                'search_index': self.search_index,
                 var_name: item_with_formatted_date,
             }
-            
-            html_content = detail_template.render(**template_vars)
-            detail_file = detail_dir / f"{item['id']}.html"
-            detail_file.write_text(html_content, encoding='utf-8')
+            pages.append((detail_dir / f"{item['id']}.html", template_vars))
+        
+        if self.pool is not None and len(pages) > 1:
+            # Render errors propagate, so a broken template fails the build
+            run_all(self.pool, render_to_file,
+                    [(content_type.detail_template, str(path), context) for path, context in pages])
+            self.written.update(path for path, _ in pages)
+        else:
+            for detail_file, template_vars in pages:
+                with self.profiler.timed('detail_pages', detail_file.relative_to(self.dist_dir)):
+                    html_content = self.render(detail_template, **template_vars)
+                self.write_output(detail_file, html_content)
         
         print(f"Built {len(items)} {content_type.name} detail pages")
     
@@ -78,7 +113,7 @@ class PageBuilder:
             if 'date' in item and item['date']:
                 context['formatted_date'] = self.format_date(item['date'])
             
-            card_html = template.render(**context)
+            card_html = self.render(template, **context)
             cards_html.append(card_html)
         
         return '\n'.join(cards_html)
@@ -92,7 +127,7 @@ class PageBuilder:
             # Use default image classes
             image_classes = "image-base image-square d-flex align-items-center justify-content-center text-white fw-bold"
             
-            card_html = template.render(
+            card_html = self.render(template,
                 id=post['id'],
                 title=post['title'],
                 excerpt=post['excerpt'],
@@ -105,8 +140,11 @@ class PageBuilder:
         
         return '\n'.join(cards_html)
     
-    def render_compact_news_cards(self, posts):
-        """Render compact news cards for the full news page."""
+    def render_compact_news_cards(self, posts, prefix: str = ''):
+        """Render compact news cards for the news listing pages.
+        
+        ``prefix`` leads from the listing page back to the site root.
+        """
         template = self.jinja_env.get_template('cards/compact-news-card.html')
         cards_html = []
         
@@ -122,27 +160,30 @@ class PageBuilder:
                 formatted_date = str(post['date'])
             
             # Render the card
-            card_html = template.render(
+            card_html = self.render(template,
                 id=post['id'],
                 title=post['title'],
                 excerpt=post['excerpt'],
                 formatted_date=formatted_date,
                 image=post['image'],
-                text=post['text']
+                text=post['text'],
+                tags=item_tags(post),
+                prefix=prefix
             )
             cards_html.append(card_html)
         
         return '\n'.join(cards_html)
     
-    def render_projects_content(self, projects):
+    def render_projects_content(self, projects, prefix: str = ''):
         """Render projects as full content articles using template."""
         template = self.jinja_env.get_template('cards/project-listing-item.html')
         content_sections = []
         
         for project in projects:
-            section_html = template.render(
+            section_html = self.render(template,
                 project=project,
-                formatted_date=self.format_date(project['date'])
+                formatted_date=self.format_date(project['date']),
+                prefix=prefix
             )
             content_sections.append(section_html)
         
@@ -154,7 +195,7 @@ class PageBuilder:
         cards_html = []
         
         for project in projects:
-            card_html = template.render(
+            card_html = self.render(template,
                 id=project['id'],
                 title=project['title'],
                 text=project['text'],
@@ -172,7 +213,7 @@ class PageBuilder:
         cards_html = []
         
         for member in members:
-            card_html = template.render(
+            card_html = self.render(template,
                 id=member['id'],
                 name=member['title'],
                 role=member['metadata'].get('role', 'Member'),
@@ -189,11 +230,13 @@ class PageBuilder:
         """Generic method to build a page with given template and context."""
         template = self.jinja_env.get_template(template_name)
         
-        # Always include site config
-        full_context = {'site': self.site_config, **context}
+        # Always include site config, the way back to the site root and the search index
+        full_context = {'site': self.site_config, 'root_prefix': root_prefix(output_filename),
+                        'search_index': self.search_index, **context}
         
-        html_content = template.render(**full_context)
+        html_content = self.render(template, **full_context)
         output_file = self.dist_dir / output_filename
-        output_file.write_text(html_content, encoding='utf-8')
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        self.write_output(output_file, html_content)
         
         return output_file
\ No newline at end of file
@@ -0,0 +1,88 @@
+"""
+Pagination module for the website builder.
+Splits long listings into numbered pages and names the tag and year archive pages.
+"""
+
+import math
+import re
+from typing import Any, Dict, List, Optional
+
+
+DEFAULT_PAGE_SIZE = 20
+# Page links shown on either side of the current page before eliding with "…"
+PAGE_LINK_WINDOW = 2
+
+
+def slugify(text: Any) -> str:
+    """URL-safe name for a tag, e.g. 'C++' -> 'cpp', 'Computer Vision' -> 'computer-vision'."""
+    text = str(text).lower().replace('+', 'p').replace('#', 'sharp')
+    return re.sub(r'[^a-z0-9]+', '-', text).strip('-') or 'untagged'
+
+
+def root_prefix(output_name: str) -> str:
+    """Relative path from an output file back to the site root."""
+    return '../' * output_name.count('/')
+
+
+def tag_archive(tag: str) -> str:
+    return f"whatsnew/tag/{slugify(tag)}.html"
+
+
+def year_archive(year: str) -> str:
+    return f"whatsnew/year/{year}.html"
+
+
+class Listing:
+    """A listing split into pages.
+
+    The first page keeps the listing's own name (``whatsnew.html``);
+    later pages go below a directory of the same name
+    (``whatsnew/page/2.html``).
+    """
+
+    def __init__(self, first_page: str, items: List[Dict[str, Any]], page_size: int,
+                 title: Optional[str] = None):
+        self.first_page = first_page
+        self.items = items
+        self.page_size = max(1, page_size)
+        self.title = title
+        self.count = max(1, math.ceil(len(items) / self.page_size))
+
+    def page_name(self, number: int) -> str:
+        if number == 1:
+            return self.first_page
+        return f"{self.first_page[:-len('.html')]}/page/{number}.html"
+
+    def page_numbers(self, current: int) -> List[Optional[int]]:
+        """First, last and nearby page numbers, with None where numbers are elided."""
+        shown = {1, self.count, *range(current - PAGE_LINK_WINDOW, current + PAGE_LINK_WINDOW + 1)}
+        numbers: List[Optional[int]] = []
+        for number in sorted(n for n in shown if 1 <= n <= self.count):
+            if numbers and number - numbers[-1] > 1:
+                numbers.append(None)
+            numbers.append(number)
+        return numbers
+
+    def navigation(self, current: int) -> Dict[str, Any]:
+        """Template context for the pagination links on one page."""
+        prefix = root_prefix(self.page_name(current))
+
+        def url(number):
+            return f"{prefix}{self.page_name(number)}"
+
+        return {
+            'number': current,
+            'count': self.count,
+            'previous': url(current - 1) if current > 1 else None,
+            'next': url(current + 1) if current < self.count else None,
+            'links': [{'number': n, 'url': url(n) if n else None, 'current': n == current}
+                      for n in self.page_numbers(current)],
+        }
+
+    def pages(self) -> List[Dict[str, Any]]:
+        """Every page with its output name, items and navigation."""
+        return [{
+            'output_name': self.page_name(number),
+            'items': self.items[(number - 1) * self.page_size:number * self.page_size],
+            'pagination': self.navigation(number),
+        } for number in range(1, self.count + 1)]
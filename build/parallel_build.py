@@ -0,0 +1,93 @@
+"""
+Parallel build module for the website builder.
+Runs markdown conversion, image encoding and detail page rendering in a process pool.
+"""
+
+from concurrent.futures import Executor, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from content_manager import ContentManager
+from markdown_cache import MarkdownCache
+from templating import create_jinja_environment
+
+
+# Per-process state, set up once by init_worker()
+_content_manager: Optional[ContentManager] = None
+_jinja_env = None
+
+
+def init_worker(content_dir: str, templates_dir: str, cache_dir: Optional[str],
+                image_index_file: Optional[str], bytecode_cache_dir: Optional[str]):
+    """Create the content manager and Jinja environment used by a worker."""
+    global _content_manager, _jinja_env
+    cache = MarkdownCache(Path(cache_dir), ContentManager.markdown_config()) if cache_dir else None
+    _content_manager = ContentManager(Path(content_dir), cache)
+    index_file = Path(image_index_file) if image_index_file else None
+    bytecode_dir = Path(bytecode_cache_dir) if bytecode_cache_dir else None
+    _jinja_env = create_jinja_environment(Path(templates_dir), index_file, bytecode_dir)
+
+
+def load_content_file(file_path: str) -> Optional[Dict[str, Any]]:
+    """Parse one markdown file in a worker process."""
+    return _content_manager.process_markdown_file(Path(file_path))
+
+
+def render_to_file(template_name: str, output_file: str, context: Dict[str, Any]) -> int:
+    """Render a template in a worker process and write the result."""
+    html_content = _jinja_env.get_template(template_name).render(**context)
+    return Path(output_file).write_text(html_content, encoding='utf-8')
+
+
+def create_pool(jobs: int, content_dir: Path, templates_dir: Path,
+                cache_dir: Optional[Path] = None,
+                image_index_file: Optional[Path] = None,
+                bytecode_cache_dir: Optional[Path] = None) -> Optional[Executor]:
+    """Start a worker pool, or return None when the build should stay serial."""
+    if jobs <= 1:
+        return None
+    return ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=init_worker,
+        initargs=(str(content_dir), str(templates_dir), str(cache_dir) if cache_dir else None,
+                  str(image_index_file) if image_index_file else None,
+                  str(bytecode_cache_dir) if bytecode_cache_dir else None),
+    )
+
+
+def run_reporting_errors(pool: Optional[Executor], func: Callable, calls: Iterable[tuple],
+                         labels: Iterable[str]) -> List[Any]:
+    """Run calls on the pool (or inline without one) and return results in order.
+
+    A call that fails is reported and yields None, so one bad content file
+    does not abort the rest of the build. Use run_all for work whose
+    failure must fail the build.
+    """
+    if pool is None:
+        futures = [(label, None, args) for label, args in zip(labels, calls)]
+    else:
+        futures = [(label, pool.submit(func, *args), args) for label, args in zip(labels, calls)]
+    results = []
+    for label, future, args in futures:
+        try:
+            results.append(future.result() if future is not None else func(*args))
+        except Exception as e:
+            print(f"Error processing {label}: {e}")
+            results.append(None)
+    return results
+
+
+def run_all(pool: Optional[Executor], func: Callable, calls: Iterable[tuple]) -> List[Any]:
+    """Run calls on the pool (or inline without one) and return results in order.
+
+    Unlike run_reporting_errors, the first failure is raised, so a broken
+    template stops a parallel build exactly like it stops a serial one.
+    """
+    if pool is None:
+        return [func(*args) for args in calls]
+    futures = [pool.submit(func, *args) for args in calls]
+    try:
+        return [future.result() for future in futures]
+    finally:
+        for future in futures:
+            future.cancel()
@@ -0,0 +1,81 @@
+"""
+Responsive image helpers for the website templates.
+Turns image paths into <picture> markup using the variants built by the image pipeline.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from markupsafe import Markup, escape
+
+
+# Width of the variant used as the plain src for browsers without srcset support
+FALLBACK_WIDTH = 640
+
+
+class ResponsiveImages:
+    """Jinja helpers backed by the image pipeline's variant index.
+
+    Images that have no variants (external URLs, SVGs, or builds without
+    Pillow) fall back to a plain ``<img>`` pointing at the original.
+    """
+
+    def __init__(self, index_file: Optional[Path]):
+        self.index_file = index_file
+        self._index: Dict[str, Any] = {}
+        self._loaded_mtime = None
+
+    def _entry(self, src: str) -> Optional[Dict[str, Any]]:
+        """Look up the variants of an image, reloading the index if it changed."""
+        if self.index_file is None:
+            return None
+        try:
+            mtime = self.index_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+        if mtime != self._loaded_mtime:
+            self._index = json.loads(self.index_file.read_text())
+            self._loaded_mtime = mtime
+        return self._index.get(src)
+
+    @staticmethod
+    def _srcset(variants: List[Dict[str, Any]], key: str, prefix: str) -> str:
+        return ', '.join(f"{prefix}{v[key]} {v['width']}w" for v in variants)
+
+    @staticmethod
+    def _fallback(variants: List[Dict[str, Any]]) -> Dict[str, Any]:
+        for variant in variants:
+            if variant['width'] >= FALLBACK_WIDTH:
+                return variant
+        return variants[-1]
+
+    @staticmethod
+    def _attributes(**attrs) -> str:
+        return ''.join(f' {name}="{escape(value)}"' for name, value in attrs.items()
+                       if value is not None)
+
+    def picture(self, src: str, alt: str = '', sizes: str = '100vw', prefix: str = '',
+                css_class: str = None, style: str = None, loading: str = 'lazy') -> Markup:
+        """Render an image as <picture> with WebP and original-format srcsets."""
+        entry = self._entry(src) if src else None
+        if entry is None:
+            return Markup('<img%s>' % self._attributes(
+                src=f"{prefix}{src}", alt=alt, **{'class': css_class}, style=style))
+        variants = entry['variants']
+        fallback = self._fallback(variants)
+        source = '<source type="image/webp"%s>' % self._attributes(
+            srcset=self._srcset(variants, 'webp', prefix), sizes=sizes)
+        img = '<img%s>' % self._attributes(
+            src=f"{prefix}{fallback['src']}", srcset=self._srcset(variants, 'src', prefix),
+            sizes=sizes, width=fallback['width'], height=fallback['height'], alt=alt,
+            **{'class': css_class}, style=style, loading=loading, decoding='async')
+        return Markup(f'<picture>{source}{img}</picture>')
+
+    def preload(self, src: str, sizes: str = '100vw', prefix: str = '') -> Markup:
+        """Render a <link rel="preload"> that lets the browser pick a WebP variant."""
+        entry = self._entry(src)
+        if entry is None:
+            return Markup('<link rel="preload"%s as="image">' % self._attributes(href=f"{prefix}{src}"))
+        return Markup('<link rel="preload" as="image" type="image/webp"%s>' % self._attributes(
+            imagesrcset=self._srcset(entry['variants'], 'webp', prefix), imagesizes=sizes))
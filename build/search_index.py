@@ -0,0 +1,42 @@
+"""
+Search index module for the website builder.
+Builds the compact JSON index that scripts/script.js loads for client-side search.
+"""
+
+import json
+from typing import Any, Dict, Iterable, List
+
+
+SEARCH_INDEX_FILE = "search-index.json"
+SEARCH_INDEX_VERSION = 1
+# Each entry is a list in this field order, which keeps the file small
+SEARCH_FIELDS = ("url", "title", "excerpt", "tags", "kind")
+EXCERPT_LENGTH = 160
+
+
+def shorten(text: str, length: int = EXCERPT_LENGTH) -> str:
+    """Collapse whitespace and cut text at a word boundary."""
+    text = ' '.join(str(text or '').split())
+    if len(text) <= length:
+        return text
+    return text[:length].rsplit(' ', 1)[0] + '…'
+
+
+class SearchIndex:
+    """Titles, excerpts and tags of every page worth finding."""
+
+    def __init__(self):
+        self.entries: List[List[Any]] = []
+
+    def add(self, url: str, title: str, excerpt: str = '', tags: Iterable[str] = (),
+            kind: str = ''):
+        if isinstance(tags, str):
+            tags = [tags]
+        self.entries.append([url, str(title), shorten(excerpt), [str(tag) for tag in tags], kind])
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'version': SEARCH_INDEX_VERSION, 'fields': list(SEARCH_FIELDS),
+                'entries': self.entries}
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), ensure_ascii=False, separators=(',', ':'))
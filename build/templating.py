@@ -0,0 +1,33 @@
+"""
+Template environment module for the website builder.
+Creates the Jinja2 environment shared by the builder and its worker processes.
+"""
+
+from pathlib import Path
+from typing import Optional
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+from pagination import slugify
+from responsive_images import ResponsiveImages
+
+
+def create_jinja_environment(templates_dir: Path, image_index_file: Optional[Path] = None,
+                             bytecode_cache_dir: Optional[Path] = None) -> Environment:
+    """Set up the Jinja2 environment for the site templates.
+    
+    With a bytecode cache directory, compiled templates are stored on disk
+    and reused by later builds and worker processes until their source changes.
+    """
+    template_paths = [str(templates_dir)]
+    bytecode_cache = None
+    if bytecode_cache_dir is not None:
+        bytecode_cache_dir.mkdir(parents=True, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(str(bytecode_cache_dir))
+    env = Environment(loader=FileSystemLoader(template_paths), bytecode_cache=bytecode_cache)
+    env.filters['slugify'] = slugify
+    
+    images = ResponsiveImages(image_index_file)
+    env.globals['responsive_image'] = images.picture
+    env.globals['preload_image'] = images.preload
+    return env
@@ -0,0 +1,39 @@
+"""
+Shared fixtures for the website builder tests.
+"""
+
+import contextlib
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+BUILD_DIR = Path(__file__).resolve().parent.parent
+REPO_ROOT = BUILD_DIR.parent
+sys.path.insert(0, str(BUILD_DIR))
+sys.path.insert(0, str(BUILD_DIR / "benchmarks"))
+
+from build_modular import WebsiteBuilder  # noqa: E402
+from synthetic_site import SyntheticSiteGenerator  # noqa: E402
+
+
+def build_site(root: Path, incremental: bool = False, jobs: int = 1) -> WebsiteBuilder:
+    """Build a site quietly and return the builder."""
+    builder = WebsiteBuilder(incremental=incremental, jobs=jobs, root_dir=root)
+    with contextlib.redirect_stdout(io.StringIO()):
+        builder.build()
+    return builder
+
+
+def snapshot(directory: Path) -> dict:
+    """Every file below a directory mapped to its bytes."""
+    return {path.relative_to(directory).as_posix(): path.read_bytes()
+            for path in sorted(directory.rglob('*')) if path.is_file()}
+
+
+@pytest.fixture
+def site(tmp_path) -> Path:
+    """A small synthetic site using the real templates and config."""
+    return SyntheticSiteGenerator(REPO_ROOT, seed=7).generate(
+        tmp_path / "site", news=30, projects=5, members=6)
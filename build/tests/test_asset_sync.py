@@ -0,0 +1,84 @@
+"""
+Tests for mirroring static asset trees into the output directory.
+"""
+
+import os
+
+import pytest
+
+from asset_sync import AssetSync
+
+
+def make_tree(root, files):
+    for relative, text in files.items():
+        path = root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+
+
+def tree_contents(root):
+    return {path.relative_to(root).as_posix(): path.read_text()
+            for path in root.rglob('*') if path.is_file()}
+
+
+@pytest.mark.parametrize("use_links", [True, False])
+def test_sync_tree_copies_then_skips(tmp_path, use_links):
+    src, dest = tmp_path / "src", tmp_path / "dest"
+    make_tree(src, {"style.css": "body {}", "js/app.js": "run()"})
+    sync = AssetSync(use_links=use_links)
+
+    assert sync.sync_tree(src, dest) == {'copied': 2, 'unchanged': 0, 'removed': 0}
+    assert tree_contents(dest) == tree_contents(src)
+    assert sync.sync_tree(src, dest) == {'copied': 0, 'unchanged': 2, 'removed': 0}
+
+
+def test_sync_tree_replaces_changed_files_without_touching_source(tmp_path):
+    src, dest = tmp_path / "src", tmp_path / "dest"
+    make_tree(src, {"style.css": "body {}"})
+    sync = AssetSync()
+    sync.sync_tree(src, dest)
+
+    (src / "style.css").unlink()
+    (src / "style.css").write_text("body { margin: 0 }")
+    assert sync.sync_tree(src, dest)['copied'] == 1
+    assert (dest / "style.css").read_text() == "body { margin: 0 }"
+
+    # Replacing an output must never write through a hardlink into the source
+    (dest / "style.css").unlink()
+    (dest / "style.css").write_text("edited output")
+    assert (src / "style.css").read_text() == "body { margin: 0 }"
+
+
+def test_sync_tree_same_bytes_new_mtime_is_unchanged(tmp_path):
+    src, dest = tmp_path / "src", tmp_path / "dest"
+    make_tree(src, {"logo.svg": "<svg/>"})
+    sync = AssetSync(use_links=False)
+    sync.sync_tree(src, dest)
+    os.utime(src / "logo.svg", ns=(0, 0))
+
+    assert sync.sync_tree(src, dest) == {'copied': 0, 'unchanged': 1, 'removed': 0}
+    assert (dest / "logo.svg").stat().st_mtime_ns == 0
+
+
+def test_sync_tree_removes_deleted_files_and_empty_directories(tmp_path):
+    src, dest = tmp_path / "src", tmp_path / "dest"
+    make_tree(src, {"style.css": "body {}", "fonts/a.woff": "a", "fonts/b.woff": "b"})
+    sync = AssetSync()
+    sync.sync_tree(src, dest)
+
+    (src / "fonts" / "a.woff").unlink()
+    (src / "fonts" / "b.woff").unlink()
+    assert sync.sync_tree(src, dest) == {'copied': 0, 'unchanged': 1, 'removed': 2}
+    assert not (dest / "fonts").exists()
+    assert tree_contents(dest) == {"style.css": "body {}"}
+
+
+def test_prune_keeps_wanted_files(tmp_path):
+    dest = tmp_path / "dest"
+    make_tree(dest, {"keep.txt": "k", "old/gone.txt": "g", "nested/deep/keep.txt": "k"})
+    wanted = {dest.joinpath("keep.txt").relative_to(dest),
+              dest.joinpath("nested/deep/keep.txt").relative_to(dest)}
+
+    assert AssetSync().prune(dest, wanted) == 1
+    assert sorted(tree_contents(dest)) == ["keep.txt", "nested/deep/keep.txt"]
+    assert not (dest / "old").exists()
@@ -0,0 +1,111 @@
+"""
+Tests for the build manifest and template dependency tracking.
+"""
+
+from jinja2 import Environment, FileSystemLoader
+
+from build_manifest import BuildManifest, TemplateDependencies
+
+
+def make_manifest(tmp_path):
+    return BuildManifest(tmp_path / ".build-cache" / "manifest.json", tmp_path)
+
+
+def test_needs_build_until_recorded(tmp_path):
+    source = tmp_path / "post.md"
+    source.write_text("one")
+    output = tmp_path / "output" / "post.html"
+    output.parent.mkdir()
+    output.write_text("<p>one</p>")
+    manifest = make_manifest(tmp_path)
+    manifest.load()
+    assert manifest.needs_build(output, [source])
+
+    manifest.record(output, [source])
+    manifest.save()
+    manifest.load()
+    assert not manifest.needs_build(output, [source])
+
+    source.write_text("two")
+    manifest.load()
+    assert manifest.needs_build(output, [source])
+
+
+def test_missing_output_needs_build(tmp_path):
+    source = tmp_path / "post.md"
+    source.write_text("one")
+    output = tmp_path / "output" / "post.html"
+    manifest = make_manifest(tmp_path)
+    manifest.load()
+    manifest.record(output, [source])
+    manifest.save()
+    manifest.load()
+    assert manifest.needs_build(output, [source])
+
+
+def test_fresh_outputs_are_carried_over_and_others_pruned(tmp_path):
+    source = tmp_path / "post.md"
+    source.write_text("one")
+    kept = tmp_path / "output" / "kept.html"
+    dropped = tmp_path / "output" / "whatsnew" / "page" / "2.html"
+    for output in (kept, dropped):
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text("html")
+    manifest = make_manifest(tmp_path)
+    manifest.load()
+    manifest.record(kept, [source])
+    manifest.record(dropped, [source])
+    manifest.save()
+
+    manifest.load()
+    assert not manifest.needs_build(kept, [source])
+    assert manifest.prune_stale_outputs() == ["output/whatsnew/page/2.html"]
+    assert kept.exists()
+    assert not dropped.exists()
+    # Emptied directories go too, but never the output directory itself
+    assert not (tmp_path / "output" / "whatsnew").exists()
+    assert (tmp_path / "output").is_dir()
+
+
+def test_input_order_does_not_matter(tmp_path):
+    first, second = tmp_path / "a.md", tmp_path / "b.md"
+    first.write_text("a")
+    second.write_text("b")
+    output = tmp_path / "out.html"
+    output.write_text("html")
+    manifest = make_manifest(tmp_path)
+    manifest.load()
+    manifest.record(output, [first, second])
+    manifest.save()
+    manifest.load()
+    assert not manifest.needs_build(output, [second, first])
+
+
+def test_template_references_are_persisted(tmp_path):
+    templates = tmp_path / "templates"
+    (templates / "layouts").mkdir(parents=True)
+    (templates / "layouts" / "base.html").write_text("{% include 'nav.html' %}{% block body %}{% endblock %}")
+    (templates / "nav.html").write_text("<nav></nav>")
+    (templates / "page.html").write_text("{% extends 'layouts/base.html' %}")
+    env = Environment(loader=FileSystemLoader(str(templates)))
+    manifest = make_manifest(tmp_path)
+    manifest.load()
+    deps = TemplateDependencies(env, templates, manifest)
+    expected = sorted(templates / name for name in ("layouts/base.html", "nav.html", "page.html"))
+    assert deps.files_for("page.html") == expected
+    manifest.save()
+
+    manifest.load()
+    deps = TemplateDependencies(env, templates, manifest)
+    parses = []
+    deps._parse_references = lambda path: parses.append(path) or []
+    assert deps.files_for("page.html") == expected
+    assert parses == []
+
+    # An edited template is parsed again
+    (templates / "nav.html").write_text("{% include 'logo.html' %}")
+    manifest.load()
+    deps = TemplateDependencies(env, templates, manifest)
+    deps._parse_references = lambda path: parses.append(path) or ["logo.html"]
+    deps.files_for("page.html")
+    assert parses == [templates / "nav.html"]
@@ -0,0 +1,61 @@
+"""
+Tests for the build profiler and the options that enable it.
+"""
+
+import json
+
+from jinja2 import DictLoader, Environment
+
+from build_modular import main, parse_args
+from build_profiler import BuildProfiler
+
+
+def exercise(profiler):
+    env = Environment(loader=DictLoader({'page.html': "<p>{{ text }}</p>"}))
+    profiler.instrument_jinja(env)
+    with profiler.phase('pages'):
+        with profiler.timed('render', 'page.html'):
+            env.get_template('page.html').render(text="hi")
+        profiler.count('pages_written')
+        profiler.count('bytes_written', 11)
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = BuildProfiler()
+    exercise(profiler)
+    report = profiler.report()
+    assert report['phases'] == {}
+    assert report['counters'] == {}
+    assert report['timings'] == {}
+
+
+def test_report_has_phases_counters_and_compiled_templates(tmp_path):
+    profiler = BuildProfiler(enabled=True)
+    exercise(profiler)
+    report = profiler.report()
+    assert set(report['phases']) == {'pages'}
+    assert report['counters'] == {'templates_compiled': 1, 'pages_written': 1, 'bytes_written': 11}
+    assert [entry['name'] for entry in report['timings']['render']] == ['page.html']
+    assert report['timings']['template_compile'][0]['calls'] == 1
+    assert 'templates_compiled' in profiler.summary()
+
+    profiler.write_json(tmp_path / "profile" / "report.json")
+    assert json.loads((tmp_path / "profile" / "report.json").read_text())['counters'] == \
+        report['counters']
+
+    profiler.reset()
+    assert profiler.report()['counters'] == {}
+
+
+def test_profile_flag_does_not_swallow_the_command():
+    args = parse_args(['--profile', 'serve'])
+    assert (args.command, args.profile, args.profile_json) == ('serve', True, None)
+    assert parse_args(['--profile-json', 'report.json']).profile_json == 'report.json'
+
+
+def test_profile_json_is_written_where_asked(site, monkeypatch, capsys):
+    monkeypatch.chdir(site)
+    main(['--profile-json', 'report.json'])
+    report = json.loads((site / "report.json").read_text())
+    assert report['counters']['templates_compiled'] > 0
+    assert 'Build profile:' in capsys.readouterr().out
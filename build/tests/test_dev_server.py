@@ -0,0 +1,86 @@
+"""
+Tests for the development server's file watching, live reload and worker reuse.
+"""
+
+import contextlib
+import io
+import json
+import threading
+import urllib.request
+from types import SimpleNamespace
+
+from build_modular import WebsiteBuilder
+from dev_server import LIVERELOAD_SCRIPT, DevServer, FileWatcher, ReloadBroadcaster
+
+
+def test_file_watcher_reports_added_modified_and_removed_files(tmp_path):
+    kept, removed = tmp_path / "kept.md", tmp_path / "sub" / "removed.md"
+    removed.parent.mkdir()
+    kept.write_text("one")
+    removed.write_text("gone soon")
+    watcher = FileWatcher([tmp_path, tmp_path / "missing"])
+    assert watcher.poll() == set()
+
+    kept.write_text("one, longer")
+    removed.unlink()
+    added = tmp_path / "sub" / "added.md"
+    added.write_text("new")
+    assert watcher.poll() == {kept, removed, added}
+    assert watcher.poll() == set()
+
+
+def test_broadcaster_wait_returns_new_messages_only():
+    broadcaster = ReloadBroadcaster()
+    assert broadcaster.wait(0, timeout=0.01) == (0, None)
+
+    timer = threading.Timer(0.05, broadcaster.publish, (["index.html"], False))
+    timer.start()
+    version, message = broadcaster.wait(0, timeout=5)
+    timer.join()
+    assert version == 1
+    assert json.loads(message) == {'pages': ["index.html"], 'assets': False}
+    assert broadcaster.wait(version, timeout=0.01) == (1, None)
+
+
+def test_served_html_gets_the_reload_script(tmp_path):
+    (tmp_path / "index.html").write_text("<html><body><p>Hi</p></body></html>")
+    (tmp_path / "fragment.html").write_text("<p>No body</p>")
+    (tmp_path / "style.css").write_text("body {}")
+    server = DevServer(SimpleNamespace(dist_dir=tmp_path), port=0).create_server()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}/"
+    try:
+        def fetch(path):
+            with urllib.request.urlopen(base + path) as response:
+                return response.read().decode('utf-8')
+
+        page = fetch("")
+        assert page.endswith(LIVERELOAD_SCRIPT + "</body></html>")
+        assert page.count("EventSource") == 1
+        assert fetch("fragment.html") == "<p>No body</p>" + LIVERELOAD_SCRIPT
+        assert fetch("style.css") == "body {}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_rebuilds_reuse_the_worker_pool(site):
+    builder = WebsiteBuilder(incremental=True, jobs=2, root_dir=site)
+    builder.open_pool()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            builder.build()
+            pool = builder.pool
+            post = sorted((site / "content" / "news").glob("*.md"))[0]
+            post.write_text(post.read_text() + "\nMore.\n")
+            builder.rebuild([post])
+            assert builder.pool is pool
+            assert f"news/{post.stem}.html" in builder.rebuilt_outputs
+
+            template = site / "templates" / "details" / "news-detail.html"
+            template.write_text(template.read_text() + "\n")
+            builder.rebuild([template])
+        assert builder.pool is not None and builder.pool is not pool
+    finally:
+        builder.close_pool()
+    assert builder.pool is None
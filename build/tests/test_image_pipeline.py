@@ -0,0 +1,44 @@
+"""
+Tests for the responsive image variants.
+"""
+
+import json
+
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+
+from conftest import build_site  # noqa: E402
+from image_pipeline import ImagePipeline  # noqa: E402
+
+
+def test_same_stem_different_formats_publish_distinct_variants(tmp_path):
+    images = tmp_path / "images"
+    images.mkdir()
+    Image.new('RGB', (400, 200), 'red').save(images / "logo.png")
+    Image.new('RGB', (400, 200), 'blue').save(images / "logo.jpg")
+    pipeline = ImagePipeline(tmp_path, tmp_path / "output", tmp_path / ".build-cache" / "images")
+
+    assert pipeline.run()['images'] == 2
+    index = json.loads(pipeline.index_file.read_text())
+    png_urls = {url for variant in index['images/logo.png']['variants']
+                for url in (variant['webp'], variant.get('src'))}
+    jpg_urls = {url for variant in index['images/logo.jpg']['variants']
+                for url in (variant['webp'], variant.get('src'))}
+    assert "variants/logo.png-320.webp" in png_urls
+    assert "variants/logo.jpg-320.webp" in jpg_urls
+    assert not png_urls & jpg_urls
+
+    with Image.open(tmp_path / "output" / "variants" / "logo.png-320.webp") as png_variant:
+        assert png_variant.convert('RGB').getpixel((0, 0))[0] > 200
+    with Image.open(tmp_path / "output" / "variants" / "logo.jpg-320.webp") as jpg_variant:
+        assert jpg_variant.convert('RGB').getpixel((0, 0))[2] > 200
+
+
+def test_logo_is_preloaded_only_where_it_is_shown(site):
+    build_site(site)
+    preload = 'rel="preload" href="images/robot-logo.png"'
+    assert preload in (site / "output" / "index.html").read_text(encoding='utf-8')
+    assert preload in (site / "output" / "whatsnew.html").read_text(encoding='utf-8')
+    assert 'robot-logo.png" as="image"' not in (site / "output" / "members.html").read_text(
+        encoding='utf-8')
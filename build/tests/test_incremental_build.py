@@ -0,0 +1,65 @@
+"""
+Tests that incremental builds produce the same output as full builds.
+"""
+
+import contextlib
+import io
+import os
+from pathlib import Path
+
+from conftest import build_site, snapshot
+
+
+def assert_matches_full_build(site):
+    incremental = snapshot(site / "output")
+    build_site(site)
+    assert incremental == snapshot(site / "output")
+
+
+def test_noop_rebuilds_nothing(site):
+    build_site(site)
+    builder = build_site(site, incremental=True)
+    assert builder.rebuilt_outputs == []
+
+
+def test_edit_matches_full_build(site):
+    build_site(site)
+    post = sorted((site / "content" / "news").glob("*.md"))[3]
+    post.write_text(post.read_text().replace('title: "', 'title: "Edited ', 1))
+    builder = build_site(site, incremental=True)
+    assert f"news/{post.stem}.html" in builder.rebuilt_outputs
+    assert "members.html" not in builder.rebuilt_outputs
+    assert_matches_full_build(site)
+
+
+def test_delete_matches_full_build(site):
+    build_site(site)
+    for post in sorted((site / "content" / "news").glob("*.md"))[:12]:
+        post.unlink()
+    build_site(site, incremental=True)
+    assert_matches_full_build(site)
+
+
+def test_broken_content_is_not_left_up_to_date(site):
+    build_site(site)
+    project = sorted((site / "content" / "projects").glob("*.md"))[0]
+    project.write_text("---\ntitle: [broken\n---\n")
+    build_site(site, incremental=True)
+    assert not (site / "output" / "projects" / f"{project.stem}.html").exists()
+    assert_matches_full_build(site)
+
+
+def test_rebuild_reparses_changed_files_with_unchanged_signature(site, monkeypatch):
+    builder = build_site(site)
+    post = sorted((site / "content" / "news").glob("*.md"))[5]
+    stat = post.stat()
+    # Same size and mtime, as after a fast edit on a coarse-mtime filesystem
+    post.write_text(post.read_text().replace('title: "', 'title: "X', 1)[:-1])
+    os.utime(post, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert post.stat().st_size == stat.st_size
+
+    monkeypatch.chdir(site / "config")
+    with contextlib.redirect_stdout(io.StringIO()):
+        builder.rebuild([Path("../content/news") / post.name])
+    assert '"X' in post.read_text()
+    assert_matches_full_build(site)
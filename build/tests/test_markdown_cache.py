@@ -0,0 +1,62 @@
+"""
+Tests for the on-disk cache of rendered markdown.
+"""
+
+import os
+
+from markdown_cache import MarkdownCache
+
+
+def make_cache(tmp_path, config=None, max_bytes=1024 * 1024):
+    return MarkdownCache(tmp_path / "markdown", config or {'extensions': ['tables']}, max_bytes)
+
+
+def test_round_trip_and_key_misses(tmp_path):
+    cache = make_cache(tmp_path)
+    key = cache.key(b"# Title\n")
+    assert cache.get(key) is None
+    cache.put(key, {'title': "Title"}, "<h1>Title</h1>")
+    assert cache.get(key) == ({'title': "Title"}, "<h1>Title</h1>")
+
+    # Editing the source or the markdown settings changes the key
+    assert cache.key(b"# Title!\n") != key
+    other = make_cache(tmp_path, {'extensions': ['tables', 'toc']})
+    assert other.key(b"# Title\n") != key
+    assert other.get(other.key(b"# Title\n")) is None
+    assert make_cache(tmp_path).key(b"# Title\n") == key
+
+
+def test_evict_removes_least_recently_read_entries(tmp_path):
+    cache = make_cache(tmp_path)
+    keys = [cache.key(f"post {number}".encode()) for number in range(3)]
+    for number, key in enumerate(keys):
+        cache.put(key, {}, "x" * 400)
+        entry = cache._entry_path(key)
+        os.utime(entry, ns=(number * 10 ** 9, number * 10 ** 9))
+    # Reading the oldest entry makes it the most recently used
+    assert cache.get(keys[0]) is not None
+
+    size = cache._entry_path(keys[0]).stat().st_size
+    cache.max_bytes = 2 * size
+    assert cache.evict() == 1
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[2]) is not None
+    assert cache.evict() == 0
+
+
+def test_corrupt_entry_is_discarded(tmp_path, capsys):
+    cache = make_cache(tmp_path)
+    key = cache.key(b"body")
+    cache.put(key, {}, "<p>body</p>")
+    cache._entry_path(key).write_bytes(b"not a pickle")
+
+    assert cache.get(key) is None
+    assert "discarding unreadable cache entry" in capsys.readouterr().out
+    assert not cache._entry_path(key).exists()
+    cache.put(key, {}, "<p>body</p>")
+    assert cache.get(key) == ({}, "<p>body</p>")
+
+
+def test_evict_without_cache_directory(tmp_path):
+    assert make_cache(tmp_path).evict() == 0
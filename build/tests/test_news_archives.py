@@ -0,0 +1,61 @@
+"""
+Tests for the tag and year archives of the news.
+"""
+
+from datetime import date
+
+from conftest import build_site
+from content_manager import item_tags
+
+
+def write_post(site, name, title, tags):
+    tag_lines = ''.join(f"  - {tag}\n" for tag in tags)
+    (site / "content" / "news" / f"{name}.md").write_text(
+        f'---\ntitle: "{title}"\ndate: "2030-01-0{len(name) % 9 + 1}"\ntags:\n{tag_lines}---\n\nBody.\n',
+        encoding='utf-8')
+
+
+def test_tags_differing_in_case_share_one_archive(site):
+    write_post(site, "upper", "Upper Case Post", ["ROS"])
+    write_post(site, "lower", "Lower Case Post", ["ros", "ROS"])
+    builder = build_site(site)
+
+    groups = builder.content_manager.by_tag(builder.content_types['news'])
+    matching = [tag for tag in groups if tag.lower() == "ros"]
+    assert len(matching) == 1
+    assert sorted(post['title'] for post in groups[matching[0]]) == [
+        "Lower Case Post", "Upper Case Post"]
+
+    archive = (site / "output" / "whatsnew" / "tag" / "ros.html").read_text(encoding='utf-8')
+    assert "Upper Case Post" in archive and "Lower Case Post" in archive
+    _, links = builder.news_archives(page_size=20)
+    assert [link['url'] for link in links['tags']].count("whatsnew/tag/ros.html") == 1
+
+
+def test_year_archives_list_their_posts(site):
+    write_post(site, "future", "Post From The Future", ["Python"])
+    build_site(site)
+    archive = (site / "output" / "whatsnew" / "year" / "2030.html").read_text(encoding='utf-8')
+    assert "Post From The Future" in archive
+
+
+def test_single_year_gets_no_year_archive(site):
+    build_site(site)
+    assert (site / "output" / "whatsnew" / "year").is_dir()
+    for post in (site / "content" / "news").glob("*.md"):
+        post.unlink()
+    write_post(site, "first", "First Post", ["Python"])
+    write_post(site, "second", "Second Post", ["Python"])
+
+    build_site(site, incremental=True)
+    assert not (site / "output" / "whatsnew" / "year").exists()
+    assert "By year" not in (site / "output" / "whatsnew.html").read_text(encoding='utf-8')
+    build_site(site)
+    assert not (site / "output" / "whatsnew" / "year").exists()
+
+
+def test_item_tags_keep_one_spelling_per_archive():
+    item = {'metadata': {'tags': "ROS, ros , C++, , Cpp"}}
+    assert item_tags(item) == ["ROS", "C++"]
+    assert item_tags({'metadata': {'tags': 2025}}) == ["2025"]
+    assert item_tags({'metadata': {'tags': date(2025, 8, 2)}}) == ["2025-08-02"]
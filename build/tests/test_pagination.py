@@ -0,0 +1,92 @@
+"""
+Tests for splitting listings into pages and naming archive pages.
+"""
+
+import pytest
+
+from conftest import build_site
+from pagination import Listing, root_prefix, slugify, tag_archive, year_archive
+
+
+@pytest.mark.parametrize("text, slug", [
+    ("C++", "cpp"),
+    ("C#", "csharp"),
+    ("Computer Vision", "computer-vision"),
+    ("  ROS2 / Gazebo ", "ros2-gazebo"),
+    ("ROS", "ros"),
+    ("!!!", "untagged"),
+    (2024, "2024"),
+])
+def test_slugify(text, slug):
+    assert slugify(text) == slug
+
+
+def test_archive_names():
+    assert tag_archive("Machine Learning") == "whatsnew/tag/machine-learning.html"
+    assert year_archive("2024") == "whatsnew/year/2024.html"
+    assert root_prefix("whatsnew/tag/ros.html") == "../../"
+    assert root_prefix("index.html") == ""
+
+
+def test_page_names():
+    listing = Listing("whatsnew.html", list(range(45)), 20)
+    assert listing.count == 3
+    assert [listing.page_name(n) for n in (1, 2, 3)] == [
+        "whatsnew.html", "whatsnew/page/2.html", "whatsnew/page/3.html"]
+    assert Listing("whatsnew/tag/ros.html", [], 20).page_name(2) == "whatsnew/tag/ros/page/2.html"
+
+
+def test_empty_listing_has_one_page():
+    pages = Listing("whatsnew.html", [], 20).pages()
+    assert len(pages) == 1
+    assert pages[0]['items'] == []
+    assert pages[0]['pagination']['previous'] is None
+    assert pages[0]['pagination']['next'] is None
+
+
+def test_pages_split_items_in_order():
+    pages = Listing("whatsnew.html", list(range(45)), 20).pages()
+    assert [page['output_name'] for page in pages] == [
+        "whatsnew.html", "whatsnew/page/2.html", "whatsnew/page/3.html"]
+    assert [page['items'] for page in pages] == [
+        list(range(20)), list(range(20, 40)), list(range(40, 45))]
+
+
+def test_page_numbers_elide_distant_pages():
+    listing = Listing("whatsnew.html", list(range(100)), 10)
+    assert listing.page_numbers(1) == [1, 2, 3, None, 10]
+    assert listing.page_numbers(4) == [1, 2, 3, 4, 5, 6, None, 10]
+    assert listing.page_numbers(5) == [1, None, 3, 4, 5, 6, 7, None, 10]
+    assert listing.page_numbers(10) == [1, None, 8, 9, 10]
+
+
+def test_navigation_links_are_relative_to_each_page():
+    listing = Listing("whatsnew.html", list(range(100)), 10)
+    first = listing.navigation(1)
+    assert first['previous'] is None
+    assert first['next'] == "whatsnew/page/2.html"
+
+    middle = listing.navigation(5)
+    assert middle['previous'] == "../../whatsnew/page/4.html"
+    assert middle['next'] == "../../whatsnew/page/6.html"
+    assert middle['links'][0] == {'number': 1, 'url': "../../whatsnew.html", 'current': False}
+    assert {'number': None, 'url': None, 'current': False} in middle['links']
+    assert [link['number'] for link in middle['links'] if link['current']] == [5]
+
+    last = listing.navigation(10)
+    assert last['next'] is None
+    assert last['previous'] == "../../whatsnew/page/9.html"
+
+
+def test_news_listing_pages_are_built_and_linked(site):
+    config = site / "config" / "site.json"
+    config.write_text(config.read_text(encoding='utf-8').replace(
+        '"news_page_size": 20', '"news_page_size": 12'), encoding='utf-8')
+    build_site(site)
+    output = site / "output"
+    assert (output / "whatsnew" / "page" / "3.html").exists()
+    assert not (output / "whatsnew" / "page" / "4.html").exists()
+    assert 'href="whatsnew/page/2.html"' in (output / "whatsnew.html").read_text(encoding='utf-8')
+    second = (output / "whatsnew" / "page" / "2.html").read_text(encoding='utf-8')
+    assert 'href="../../whatsnew.html"' in second
+    assert 'href="../../whatsnew/page/3.html"' in second
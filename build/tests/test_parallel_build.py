@@ -0,0 +1,26 @@
+"""
+Tests that parallel builds match serial builds, including how they fail.
+"""
+
+import shutil
+
+import pytest
+from jinja2 import UndefinedError
+
+from conftest import build_site, snapshot
+
+
+def test_jobs_output_is_byte_identical(site):
+    build_site(site)
+    serial = snapshot(site / "output")
+    shutil.rmtree(site / ".build-cache")
+    build_site(site, jobs=2)
+    assert snapshot(site / "output") == serial
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_broken_detail_template_fails_the_build(site, jobs):
+    template = site / "templates" / "details" / "member-detail.html"
+    template.write_text(template.read_text().replace("member.title", "member.title.missing()", 1))
+    with pytest.raises(UndefinedError):
+        build_site(site, jobs=jobs)
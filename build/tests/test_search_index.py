@@ -0,0 +1,31 @@
+"""
+Tests for the client-side search index and the search box linking to it.
+"""
+
+import contextlib
+import io
+import json
+
+from build_modular import WebsiteBuilder
+from conftest import build_site
+
+
+def test_search_box_points_at_the_written_index(site):
+    build_site(site)
+    index = json.loads((site / "output" / "search-index.json").read_text(encoding='utf-8'))
+    assert index['fields'][0] == "url"
+    assert len(index['entries']) == 30 + 5 + 6
+
+    post = next((site / "output" / "news").glob("*.html")).read_text(encoding='utf-8')
+    assert 'data-index="../search-index.json"' in post
+
+
+def test_no_search_box_without_an_index(site):
+    builder = WebsiteBuilder(root_dir=site)
+    builder.page_builder.search_index = None
+    with contextlib.redirect_stdout(io.StringIO()):
+        builder.build()
+    for page in ("about.html", "whatsnew.html", "members.html"):
+        assert 'site-search' not in (site / "output" / page).read_text(encoding='utf-8')
+    post = next((site / "output" / "news").glob("*.html")).read_text(encoding='utf-8')
+    assert 'site-search' not in post
@@ -0,0 +1,31 @@
+"""
+Tests for the synthetic benchmark site generator.
+"""
+
+import pytest
+
+from conftest import REPO_ROOT
+from synthetic_site import MARKER_FILE, SyntheticSiteGenerator
+
+
+def test_regenerates_its_own_site(tmp_path):
+    generator = SyntheticSiteGenerator(REPO_ROOT, seed=3)
+    root = generator.generate(tmp_path / "site", news=2, projects=1, members=1)
+    assert (root / MARKER_FILE).is_file()
+    (root / "stray.txt").write_text("left over")
+
+    generator.generate(root, news=1, projects=1, members=1)
+    assert not (root / "stray.txt").exists()
+    assert len(list((root / "content" / "news").glob("*.md"))) == 1
+
+
+def test_refuses_to_replace_other_directories(tmp_path):
+    (tmp_path / "notes.txt").write_text("keep me")
+    with pytest.raises(ValueError):
+        SyntheticSiteGenerator(REPO_ROOT).generate(tmp_path, news=1, projects=1, members=1)
+    assert (tmp_path / "notes.txt").read_text() == "keep me"
+
+
+def test_fills_an_empty_directory(tmp_path):
+    root = SyntheticSiteGenerator(REPO_ROOT).generate(tmp_path, news=1, projects=1, members=1)
+    assert (root / MARKER_FILE).is_file()
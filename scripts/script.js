@@ -30,4 +30,90 @@ document.addEventListener('DOMContentLoaded', function() {
             // Let regular links (like members.html) work normally
         });
     });
-});
\ No newline at end of file
+});
+// Client-side search: the index is only fetched once someone starts searching
+function setupSiteSearch(form) {
+    const input = form.querySelector('input');
+    const results = form.querySelector('.site-search-results');
+    const root = form.dataset.root || '';
+    let entries = null;
+    let loading = null;
+
+    function loadIndex() {
+        if (!loading) {
+            loading = fetch(form.dataset.index)
+                .then(response => response.json())
+                .then(index => {
+                    // Entries are arrays in the order given by index.fields
+                    entries = index.entries.map(values => {
+                        const entry = {};
+                        index.fields.forEach((field, i) => { entry[field] = values[i]; });
+                        entry.haystack = [entry.title, entry.excerpt, entry.tags.join(' ')].join(' ').toLowerCase();
+                        return entry;
+                    });
+                })
+                .catch(() => { loading = null; });
+        }
+        return loading;
+    }
+
+    function search(query) {
+        const terms = query.toLowerCase().split(/\s+/).filter(Boolean);
+        if (!terms.length || !entries) {
+            return [];
+        }
+        return entries
+            .filter(entry => terms.every(term => entry.haystack.includes(term)))
+            .slice(0, 10);
+    }
+
+    function show(matches) {
+        results.replaceChildren(...matches.map(entry => {
+            const link = document.createElement('a');
+            link.className = 'list-group-item list-group-item-action';
+            link.href = root + entry.url;
+            const title = document.createElement('div');
+            title.className = 'fw-bold';
+            title.textContent = entry.title;
+            const detail = document.createElement('small');
+            detail.className = 'text-muted';
+            detail.textContent = [entry.kind, entry.excerpt].filter(Boolean).join(' · ');
+            link.append(title, detail);
+            return link;
+        }));
+        if (!matches.length && input.value.trim()) {
+            const empty = document.createElement('div');
+            empty.className = 'list-group-item text-muted';
+            empty.textContent = 'No results';
+            results.append(empty);
+        }
+        results.hidden = !input.value.trim();
+    }
+
+    input.addEventListener('focus', loadIndex);
+    input.addEventListener('input', () => {
+        loadIndex().then(() => show(search(input.value)));
+    });
+    input.addEventListener('keydown', e => {
+        if (e.key === 'Escape') {
+            input.value = '';
+            results.hidden = true;
+        }
+    });
+    form.addEventListener('submit', e => {
+        e.preventDefault();
+        const first = results.querySelector('a');
+        if (first) {
+            window.location.href = first.href;
+        }
+    });
+    document.addEventListener('click', e => {
+        if (!form.contains(e.target)) {
+            results.hidden = true;
+        }
+    });
+}
+
+document.addEventListener('DOMContentLoaded', function() {
+    document.querySelectorAll('.site-search').forEach(setupSiteSearch);
+});